@@ -5,14 +5,27 @@ Agent Development Kit (ADK). Agents are organized hierarchically with
 specialized roles.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Any, Dict, List
+import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from datetime import datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
-from .llm import LLMProviderError, get_llm
-from .state import DisruptionState, log_reasoning, record_decision
+from ..config import settings
+from .batcher import LLMBatcher
+from .cache import TTLCache
+from .llm import LLMProviderError, get_llm, transient_llm_errors
+from .serialization import json_dumps, json_loads, payload_digest
+from .state import DisruptionState, get_flight_summary, log_reasoning, record_decision
 from .tools import (
     predictive_signal_tool,
     rebooking_tool,
@@ -23,77 +36,450 @@ from .tools import (
 
 logger = logging.getLogger(__name__)
 
+# Risk-probability bands. bisect_left counts the thresholds strictly below the
+# value, matching the "> threshold" comparisons these tables replace.
+_SEVERITY_THRESHOLDS = (0.4, 0.6, 0.8)
+_SEVERITY_LEVELS = ("low", "medium", "high", "critical")
+_PRIORITY_THRESHOLDS = (0.6, 0.8)
+_PRIORITY_LEVELS = ("medium", "high", "critical")
+_DURATION_THRESHOLDS = (0.6, 0.8)
+_DURATION_MINUTES = (120, 180, 240)
+_PAX_IMPACT_THRESHOLDS = (0.5, 0.7)
+_PAX_IMPACT_LEVELS = ("low", "medium", "high")
+
+# Final-plan fields the aggregator adds on top of the sub-agent outputs
+_AGGREGATE_AUDIT_KEYS = (
+    "disruption_detected",
+    "recommended_action",
+    "priority",
+    "confidence",
+    "decision_count",
+    "generated_at",
+)
+
+_DETECTED = "DETECTED ✓"
+_NOT_DETECTED = "NOT DETECTED ✗"
+
+
+class _Thousands:
+    """Defers ``{:,}`` formatting of a log argument until the record is emitted."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return f"{self.value:,}"
+
+
+# Read-only default for missing input sections, so lookups do not allocate.
+_NO_STATS: Mapping[str, Any] = MappingProxyType({})
+# Fallbacks for fields missing from the monitor payload or upstream plans
+_DEFAULT_SIGNAL_SCORE = 0.5
+_DEFAULT_RISK_PROBABILITY = 0.75
+_DEFAULT_PAX = 200
+_DEFAULT_DELAY_MINUTES = 120
+# Share of affected passengers handled as VIPs, by operating carrier.
+# Business-heavy long-haul networks carry more premium passengers.
+_VIP_RATIO_BY_CARRIER: Mapping[str, float] = MappingProxyType({"CX": 0.12, "KA": 0.08})
+_DEFAULT_VIP_RATIO = 0.1
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Parsed LLM replies keyed by (agent name, prompt). Repeated analyses of the
+# same airport/carrier snapshot skip the provider round trip entirely.
+_LLM_RESPONSE_CACHE = TTLCache(
+    maxsize=settings.llm_cache_size, ttl=settings.llm_cache_ttl
+)
+# Opt-in (LLM_MAX_LATENCY_MS > 0): coalesces identical prompts from
+# concurrent workflow runs into a single provider call.
+_LLM_BATCHER = LLMBatcher(
+    max_batch=settings.llm_max_batch, max_latency_ms=settings.llm_max_latency_ms
+)
+
+# Static instructions go first (as the system message) and only the small
+# dynamic payload follows, so providers can serve the shared prefix from their
+# prompt cache on repeated runs.
+_ORCHESTRATOR_SYSTEM_PROMPT = (
+    "You are an airline operations orchestrator analyzing a potential disruption.\n\n"
+    "Task:\n"
+    "1. Assess whether intervention is required\n"
+    "2. Produce a main action plan with priority actions\n"
+    "3. Simulate two what-if scenarios:\n"
+    "   - delay_3hr: delay extends beyond three hours\n"
+    "   - crew_unavailable: relief crew cannot report in time\n\n"
+    "Return ONLY JSON with:\n"
+    "{\n"
+    '  "requires_intervention": true/false,\n'
+    '  "severity": "low|medium|high|critical",\n'
+    '  "main_plan": {"description": "...", "priority_actions": []},\n'
+    '  "what_if_scenarios": [\n'
+    '    {"scenario": "delay_3hr", "plan": {"description": "...", "actions": []}},\n'
+    '    {"scenario": "crew_unavailable", "plan": {"description": "...", "actions": []}}\n'
+    "  ],\n"
+    '  "reasoning": "..."\n'
+    "}"
+)
+
+_RISK_SYSTEM_PROMPT = (
+    "You are an airline risk officer. Analyze the risk snapshot provided by the "
+    "user and provide a JSON payload that estimates likelihood, duration, "
+    "passenger impact, and regulatory exposure.\n\n"
+    "JSON schema:\n"
+    "{\n"
+    '  "likelihood": 0.0 - 1.0,\n'
+    '  "duration_minutes": int,\n'
+    '  "pax_impact": "low|medium|high",\n'
+    '  "regulatory_risk": "...",\n'
+    '  "reasoning": "..."\n'
+    "}"
+)
+
+_REBOOKING_SYSTEM_PROMPT = (
+    "You are the passenger disruption lead. Refine the draft rebooking plan "
+    "generated by our tools and ensure the output stays in JSON.\n\n"
+    "Return JSON with the same fields (strategy, hotel_required, vip_priority, "
+    "estimated_pax, vip_count, delay_minutes, actions, reasoning)."
+)
+
+_FINANCE_SYSTEM_PROMPT = (
+    "You are an airline finance controller. Cross-check the disruption "
+    "estimate from our deterministic tool and adjust if needed. Keep the "
+    "same JSON keys (compensation_usd, hotel_meals_usd, operational_usd, "
+    "total_usd, breakdown, reasoning)."
+)
+
+_CREW_SYSTEM_PROMPT = (
+    "You are a crew scheduling expert reviewing system recommendations. "
+    "Adjust the JSON plan if needed while preserving the same keys "
+    "(crew_changes_needed, backup_crew_required, regulatory_issues, "
+    "actions, reasoning)."
+)
+
+_BATCH_SYSTEM_PROMPT = (
+    "You are the disruption response desk, answering for four specialists at "
+    "once. The user message has one section per specialist. Return ONLY one "
+    'JSON object with the keys "risk", "rebooking", "finance" and "crew", each '
+    "holding that specialist's JSON answer as described below.\n\n"
+    f"## risk\n{_RISK_SYSTEM_PROMPT}\n\n"
+    f"## rebooking\n{_REBOOKING_SYSTEM_PROMPT}\n\n"
+    f"## finance\n{_FINANCE_SYSTEM_PROMPT}\n\n"
+    f"## crew\n{_CREW_SYSTEM_PROMPT}"
+)
+
+# Human-message templates, formatted with pre-serialized JSON strings.
+_ORCHESTRATOR_HUMAN_TEMPLATE = "Risk:\n{risk_json}\n\nFlight Data:\n{flight_json}"
+_RISK_HUMAN_TEMPLATE = "Risk Data:\n{risk_json}"
+_REBOOKING_HUMAN_TEMPLATE = "Tool Plan:\n{plan_json}\n\nSample Critical Flight:\n{sample_json}"
+_FINANCE_HUMAN_TEMPLATE = "Context:\n{context_json}"
+_CREW_HUMAN_TEMPLATE = "Tool Recommendation:\n{plan_json}\n\nFlight Stats:\n{stats_json}"
+
+
+@lru_cache(maxsize=None)
+def _system_message(text: str) -> SystemMessage:
+    """Wrap a static prompt, marking it cacheable where the provider needs a hint.
+    
+    Built once per prompt so every call sends the same message object.
+    """
+    if settings.llm_provider == "openrouter" and settings.llm_model.startswith("anthropic/"):
+        return SystemMessage(
+            content=[
+                {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+            ]
+        )
+    return SystemMessage(content=text)
+
 
 def _content_to_text(content: Any) -> str:
     """Normalize LangChain responses into a string."""
     if isinstance(content, str):
         return content
     if isinstance(content, list):
-        parts: list[str] = []
-        for item in content:
-            if isinstance(item, dict) and "text" in item:
-                parts.append(str(item["text"]))
-            else:
-                parts.append(str(item))
-        return "\n".join(parts)
+        # str.join materializes its argument anyway, so a list comprehension
+        # beats both the append loop and a generator.
+        return "\n".join(
+            [
+                str(item["text"]) if isinstance(item, dict) and "text" in item else str(item)
+                for item in content
+            ]
+        )
     return str(content)
 
 
 def _parse_json_block(text: str) -> Dict[str, Any] | None:
     """Extract and parse JSON from an LLM response."""
     snippet = text.strip()
-    if "```json" in snippet:
-        snippet = snippet.split("```json", 1)[1]
-        snippet = snippet.split("```", 1)[0]
-    elif snippet.startswith("```"):
-        snippet = snippet.strip("`")
-    snippet = snippet.strip()
+    if not snippet.startswith("{"):
+        match = _JSON_FENCE.search(snippet)
+        if match:
+            snippet = match.group(1).strip()
     if not snippet:
         return None
     try:
-        return json.loads(snippet)
+        return json_loads(snippet)
     except json.JSONDecodeError:
         logger.warning("Failed to parse LLM JSON response: %s", snippet[:200])
         return None
 
 
+def _input_summary(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Audit view of the monitor payload: scalars and stats, list sizes only.
+    
+    The flight and alert lists are the caller's own input and can run to
+    hundreds of records, so the audit trail records their counts.
+    """
+    summary = {
+        "airport": input_data.get("airport"),
+        "carrier": input_data.get("carrier"),
+        "stats": input_data.get("stats"),
+        "flight_count": len(input_data.get("flights") or ()),
+        "alert_count": len(input_data.get("alerts") or ()),
+    }
+    if "disruption" in input_data:
+        summary["disruption"] = input_data["disruption"]
+    return summary
+
+
+def _iso_date_prefix(value: Any) -> str | None:
+    """Return the ``YYYY-MM-DD`` date of an ISO timestamp, or None.
+    
+    Extended-format timestamps are sliced without building a datetime; only
+    other forms (e.g. basic ``20251201T1000``) go through ``fromisoformat``.
+    """
+    if not isinstance(value, str):
+        return None
+    match = _ISO_DATE.match(value)
+    if match:
+        return match.group()
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).date().isoformat()
+    except ValueError:
+        return None
+
+
+def _render_scenarios(state: DisruptionState) -> List[Dict[str, Any]]:
+    """Attach the relevant agent decisions to each what-if template."""
+    templates = state.what_if_templates or _default_templates()
+    keys = [
+        template.get("scenario") or template.get("name") or "unknown"
+        for template in templates
+    ]
+    # Bucket the decisions in one pass (preserving log order) rather than
+    # rescanning the whole decision log for every template.
+    buckets: Dict[str, List[Dict[str, Any]]] = {key: [] for key in keys}
+    for decision in state.decision_log:
+        scenarios = decision.get("scenarios") or ()
+        if "global" in scenarios:
+            for bucket in buckets.values():
+                bucket.append(decision)
+            continue
+        for scenario in dict.fromkeys(scenarios):
+            bucket = buckets.get(scenario)
+            if bucket is not None:
+                bucket.append(decision)
+    
+    rendered = []
+    for template, scenario_key in zip(templates, keys):
+        plan = template.get("plan", template.get("details", {}))
+        rendered.append(
+            {
+                "scenario": scenario_key,
+                "plan": plan,
+                "summary": template.get("description") or plan.get("description"),
+                "agent_decisions": list(buckets[scenario_key]),
+            }
+        )
+    return rendered
+
+
+def _default_templates() -> List[Dict[str, Any]]:
+    return [
+        {
+            "scenario": "delay_3hr",
+            "description": "Extended delay beyond three hours",
+            "plan": {
+                "description": "Issue EU261/HKCAD support",
+                "actions": [
+                    "Deploy hotel vouchers",
+                    "Send proactive comms",
+                    "Coordinate with finance for extra budget",
+                ],
+            },
+        },
+        {
+            "scenario": "crew_unavailable",
+            "description": "Relief crew cannot report in time",
+            "plan": {
+                "description": "Trigger crew contingency roster",
+                "actions": [
+                    "Activate reserve crew",
+                    "Re-sequence departures",
+                    "Notify rostering control",
+                ],
+            },
+        },
+    ]
+
+
+def _json_object_closed(text: str, state: List[int]) -> bool:
+    """Scan a streamed chunk and report when the top-level JSON object closes.
+
+    ``state`` carries ``[depth, in_string, escaped, started]`` across chunks so
+    the scan is linear in the total reply length. Anything before the first
+    ``{`` (such as a Markdown fence) is ignored.
+    """
+    depth, in_string, escaped, started = state
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = 0
+            elif char == "\\":
+                escaped = 1
+            elif char == '"':
+                in_string = 0
+        elif char == '"':
+            in_string = started
+        elif char in "{[":
+            depth += 1
+            started = 1
+        elif char in "}]" and started:
+            depth -= 1
+            if depth == 0:
+                state[:] = [depth, in_string, escaped, started]
+                return True
+    state[:] = [depth, in_string, escaped, started]
+    return False
+
+
+# Dedicated pool for clients without ainvoke, so they cannot starve the
+# default executor used by other asyncio work.
+_SYNC_LLM_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-invoke")
+
+# get_llm memoizes one client per event loop, shared by every agent on it. A
+# provider that fails to build is not retried; every agent then falls back to
+# its heuristics.
+_SHARED_LLM_FAILED = False
+
+
+def _shared_llm() -> Any:
+    global _SHARED_LLM_FAILED
+    if _SHARED_LLM_FAILED:
+        return None
+    try:
+        return get_llm()
+    except LLMProviderError as exc:
+        _SHARED_LLM_FAILED = True
+        logger.warning("LLM unavailable, agents will use heuristics: %s", exc)
+        return None
+
+
 class LLMBackedAgent:
     """Mixin that wires ADK agents to the configured LLM provider."""
 
-    def __init__(self):
-        self._llm = None
-        self._llm_failed = False
+    __slots__ = ("name",)
+
+    # Stream the reply and stop reading as soon as the JSON object is complete,
+    # so trailing tokens (closing fences, commentary) never delay the next agent.
+    stream_llm = True
+    # Reuse replies for identical prompts; opt out for agents whose answers
+    # must vary between runs.
+    cache_llm_replies = True
 
     def _ensure_llm(self):
-        if self._llm_failed:
-            return None
-        if self._llm is None:
-            try:
-                self._llm = get_llm()
-            except LLMProviderError as exc:
-                self._llm_failed = True
-                logger.warning("%s unavailable: %s", getattr(self, "name", "LLMAgent"), exc)
-                return None
-        return self._llm
-
-    async def _invoke_llm_json(self, prompt: str) -> Dict[str, Any] | None:
+        return _shared_llm()
+
+    @staticmethod
+    def _merge_nonnull(
+        base: Dict[str, Any], override: Dict[str, Any] | None
+    ) -> Dict[str, Any]:
+        """Copy ``base`` and overlay the non-null fields of the LLM refinement."""
+        merged = dict(base)
+        if override:
+            for key, value in override.items():
+                if value is not None:
+                    merged[key] = value
+        return merged
+
+    def _invoke_kwargs(self) -> Dict[str, Any]:
+        # OpenAI routes requests sharing a cache key to the same prefix cache.
+        if settings.llm_provider == "openai" and not settings.openai_base_url:
+            name = getattr(self, "name", "LLMAgent")
+            return {"extra_body": {"prompt_cache_key": f"agent:{name}:v1"}}
+        return {}
+
+    def _cache_key(self, messages: List[BaseMessage]) -> str:
+        # A fixed-size digest keeps the cache from holding every prompt's text.
+        digest = hashlib.blake2b(getattr(self, "name", "LLMAgent").encode(), digest_size=16)
+        for message in messages:
+            digest.update(b"\0")
+            digest.update(_content_to_text(message.content).encode())
+        return digest.hexdigest()
+
+    async def _invoke_llm_json(self, messages: List[BaseMessage]) -> Dict[str, Any] | None:
+        cache_key = None
+        if self.cache_llm_replies and _LLM_RESPONSE_CACHE.enabled:
+            cache_key = self._cache_key(messages)
+            cached = _LLM_RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                # Stored serialized, so callers get a fresh copy they may mutate.
+                return json_loads(cached)
+
         llm = self._ensure_llm()
         if not llm:
             return None
 
-        messages = [HumanMessage(content=prompt)]
         try:
-            if hasattr(llm, "ainvoke"):
-                response = await llm.ainvoke(messages)  # type: ignore[attr-defined]
+            if _LLM_BATCHER.enabled and hasattr(llm, "ainvoke"):
+                # Coalescing needs whole replies, so batching takes precedence.
+                response = await _LLM_BATCHER.submit(llm, messages, **self._invoke_kwargs())
+                text = _content_to_text(getattr(response, "content", response))
+            elif self.stream_llm and hasattr(llm, "astream"):
+                text = await self._stream_llm_text(llm, messages)
+            elif hasattr(llm, "ainvoke"):
+                response = await llm.ainvoke(messages, **self._invoke_kwargs())  # type: ignore[attr-defined]
+                text = _content_to_text(getattr(response, "content", response))
             else:
-                response = llm.invoke(messages)  # type: ignore[call-arg]
-        except Exception as exc:  # pragma: no cover - network failures
-            logger.error("%s LLM call failed: %s", getattr(self, "name", "LLMAgent"), exc)
+                # Sync-only clients run on a worker thread so a slow provider
+                # does not stall the other agents sharing the event loop.
+                response = await asyncio.get_running_loop().run_in_executor(
+                    _SYNC_LLM_EXECUTOR,
+                    partial(llm.invoke, messages, **self._invoke_kwargs()),
+                )
+                text = _content_to_text(getattr(response, "content", response))
+        except transient_llm_errors() as exc:
+            logger.error(
+                "%s LLM call failed (%s): %s",
+                getattr(self, "name", "LLMAgent"),
+                type(exc).__name__,
+                exc,
+            )
+            return None
+        except Exception:
+            # Any other provider failure still degrades to the heuristic plan
+            # rather than aborting the workflow.
+            logger.exception(
+                "%s LLM call failed unexpectedly", getattr(self, "name", "LLMAgent")
+            )
             return None
 
-        content = getattr(response, "content", response)
-        text = _content_to_text(content)
-        return _parse_json_block(text)
+        parsed = _parse_json_block(text)
+        if parsed is not None and cache_key is not None:
+            _LLM_RESPONSE_CACHE.set(cache_key, json_dumps(parsed))
+        return parsed
+
+    async def _stream_llm_text(self, llm: Any, messages: List[BaseMessage]) -> str:
+        """Accumulate a streamed reply, closing the stream once the JSON is whole."""
+        parts: List[str] = []
+        scan_state = [0, 0, 0, 0]
+        async with aclosing(llm.astream(messages, **self._invoke_kwargs())) as stream:
+            async for chunk in stream:
+                piece = _content_to_text(getattr(chunk, "content", chunk))
+                parts.append(piece)
+                if _json_object_closed(piece, scan_state):
+                    break
+        return "".join(parts)
 
 
 class PredictiveAgent:
@@ -103,6 +489,8 @@ class PredictiveAgent:
     potential disruptions before they occur.
     """
     
+    __slots__ = ("name",)
+    
     def __init__(self):
         self.name = "PredictiveAgent"
     
@@ -115,50 +503,50 @@ class PredictiveAgent:
         Returns:
             Updated state with risk assessment
         """
-        logger.info("=" * 80)
-        logger.info("🧠 PREDICTIVE AGENT (ADK): Starting disruption analysis...")
-        logger.info("=" * 80)
+        logger.info(
+            "🧠 PREDICTIVE AGENT (ADK): Starting disruption analysis...",
+            extra={"agent": self.name, "event": "agent_start"},
+        )
         
         input_data = state.input_data
-        stats = input_data.get("stats", {})
         
         # If a confirmed disruption is present in the input payload (e.g. from
         # Mongo-backed reaccommodation flows), treat that as ground truth and
         # skip heuristic prediction.
         disruption = input_data.get("disruption")
         if disruption:
-            disruption_type = disruption.get("type", "disruption") if isinstance(disruption, dict) else "disruption"
-            reasoning = f"Confirmed disruption: {disruption_type}"
-            logger.info("⚠️  Confirmed disruption present in input payload - skipping predictive heuristic")
-            state.disruption_detected = True
-            state.risk_assessment = {
-                "risk_probability": 1.0,
-                "reasoning": reasoning,
-            }
-            state.signal_breakdown = {}
-            state = log_reasoning(state, self.name, input_data, state.risk_assessment)
-            return state
+            return self._apply_confirmed_disruption(state, disruption)
 
+        stats = input_data.get("stats") or _NO_STATS
         # Call predictive tool
         result = await predictive_signal_tool(
             airport=input_data.get("airport", "HKG"),
             carrier=input_data.get("carrier", "CX"),
-            weather_score=stats.get("weatherScore", 0.5),
-            aircraft_score=stats.get("aircraftScore", 0.5),
-            crew_score=stats.get("crewScore", 0.5),
+            weather_score=stats.get("weatherScore", _DEFAULT_SIGNAL_SCORE),
+            aircraft_score=stats.get("aircraftScore", _DEFAULT_SIGNAL_SCORE),
+            crew_score=stats.get("crewScore", _DEFAULT_SIGNAL_SCORE),
             payload=input_data,
         )
         
         logger.info(
-            f"🎯 Risk Probability: {result['risk_probability']:.2%} | "
-            f"Disruption: {'DETECTED ✓' if result['disruption_detected'] else 'NOT DETECTED ✗'}"
+            "🎯 Risk Probability: %.2f%% | Disruption: %s",
+            result["risk_probability"] * 100,
+            _DETECTED if result["disruption_detected"] else _NOT_DETECTED,
+            extra={
+                "agent": self.name,
+                "event": "agent_result",
+                "risk_probability": result["risk_probability"],
+                "disruption_detected": result["disruption_detected"],
+            },
         )
         
         state.disruption_detected = result["disruption_detected"]
         state.risk_assessment = result
         state.signal_breakdown = result.get("signal_breakdown", {})
+        if state.disruption_detected:
+            get_flight_summary(state)
         
-        state = log_reasoning(state, self.name, input_data, result)
+        state = log_reasoning(state, self.name, _input_summary(input_data), result)
         scenarios = ["delay_3hr", "crew_unavailable"] if state.disruption_detected else ["global"]
         state = record_decision(
             state,
@@ -174,6 +562,21 @@ class PredictiveAgent:
         
         return state
 
+    def _apply_confirmed_disruption(self, state: DisruptionState, disruption: Any) -> DisruptionState:
+        """Record a confirmed disruption as certain without awaiting the signal tool."""
+        disruption_type = disruption.get("type", "disruption") if isinstance(disruption, dict) else "disruption"
+        logger.info("⚠️  Confirmed disruption present in input payload - skipping predictive heuristic")
+        state.disruption_detected = True
+        state.risk_assessment = {
+            "risk_probability": 1.0,
+            "reasoning": f"Confirmed disruption: {disruption_type}",
+        }
+        state.signal_breakdown = {}
+        get_flight_summary(state)
+        return log_reasoning(
+            state, self.name, _input_summary(state.input_data), state.risk_assessment
+        )
+
 
 class OrchestratorAgent(LLMBackedAgent):
     """Orchestrator agent for coordinating disruption response.
@@ -182,6 +585,8 @@ class OrchestratorAgent(LLMBackedAgent):
     and simulates what-if scenarios.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__()
         self.name = "OrchestratorAgent"
@@ -195,21 +600,43 @@ class OrchestratorAgent(LLMBackedAgent):
         Returns:
             Updated state with orchestration plan and scenarios
         """
-        logger.info("🎯 ORCHESTRATOR AGENT (ADK): Coordinating response...")
+        logger.info("🎯 ORCHESTRATOR AGENT (ADK): Coordinating response...", extra={"agent": self.name, "event": "agent_start"})
         
-        risk = state.risk_assessment
-        prompt = self._orchestrator_prompt(state)
-        output = await self._invoke_llm_json(prompt)
+        # Snapshot the risk before awaiting: the sub-agents run concurrently and
+        # enrich state.risk_assessment in place. It is serialized once for the
+        # prompt, and the audit trail references it by digest.
+        risk = dict(state.risk_assessment)
+        risk_json = json_dumps(risk, sort_keys=True)
+        messages = self._orchestrator_prompt(state, risk_json)
+        output = await self._invoke_llm_json(messages)
         if not output:
             output = self._fallback_plan(state, risk)
         
         state.what_if_templates = output.get("what_if_scenarios", [])
+        # Preliminary scenarios for progress consumers; the aggregator re-renders
+        # them with every sub-agent decision attached.
+        state.simulation_results = _render_scenarios(state)
         logger.info(
-            f"⚡ Decision: Intervention={'Yes' if output['requires_intervention'] else 'No'}, "
-            f"Severity={output['severity']}"
+            "⚡ Decision: Intervention=%s, Severity=%s",
+            "Yes" if output["requires_intervention"] else "No",
+            output["severity"],
+            extra={
+                "agent": self.name,
+                "event": "agent_result",
+                "requires_intervention": output["requires_intervention"],
+                "severity": output["severity"],
+            },
         )
         
-        state = log_reasoning(state, self.name, {"risk": risk}, output)
+        state = log_reasoning(
+            state,
+            self.name,
+            {
+                "risk_ref": payload_digest(risk_json),
+                "risk_probability": risk.get("risk_probability"),
+            },
+            output,
+        )
         state = record_decision(
             state,
             self.name,
@@ -225,48 +652,24 @@ class OrchestratorAgent(LLMBackedAgent):
         
         return state
     
-    def _calculate_severity(self, risk_prob: float) -> str:
+    @staticmethod
+    def _calculate_severity(risk_prob: float) -> str:
         """Calculate severity level from risk probability."""
-        if risk_prob > 0.8:
-            return "critical"
-        elif risk_prob > 0.6:
-            return "high"
-        elif risk_prob > 0.4:
-            return "medium"
-        else:
-            return "low"
-
-    def _orchestrator_prompt(self, state: DisruptionState) -> str:
-        input_summary = {
-            "risk": state.risk_assessment,
-            "flight_data": {
-                "airport": state.input_data.get("airport"),
-                "carrier": state.input_data.get("carrier"),
-                "stats": state.input_data.get("stats"),
-            },
-        }
-        return (
-            "You are an airline operations orchestrator analyzing a potential disruption.\n\n"
-            "Input Data:\n"
-            f"{json.dumps(input_summary, indent=2)}\n\n"
-            "Task:\n"
-            "1. Assess whether intervention is required\n"
-            "2. Produce a main action plan with priority actions\n"
-            "3. Simulate two what-if scenarios:\n"
-            "   - delay_3hr: delay extends beyond three hours\n"
-            "   - crew_unavailable: relief crew cannot report in time\n\n"
-            "Return ONLY JSON with:\n"
-            "{\n"
-            '  "requires_intervention": true/false,\n'
-            '  "severity": "low|medium|high|critical",\n'
-            '  "main_plan": {"description": "...", "priority_actions": []},\n'
-            '  "what_if_scenarios": [\n'
-            '    {"scenario": "delay_3hr", "plan": {"description": "...", "actions": []}},\n'
-            '    {"scenario": "crew_unavailable", "plan": {"description": "...", "actions": []}}\n'
-            "  ],\n"
-            '  "reasoning": "..."\n'
-            "}"
-        )
+        return _SEVERITY_LEVELS[bisect_left(_SEVERITY_THRESHOLDS, risk_prob)]
+
+    def _orchestrator_prompt(
+        self, state: DisruptionState, risk_json: str | None = None
+    ) -> List[BaseMessage]:
+        summary = get_flight_summary(state)
+        return [
+            _system_message(_ORCHESTRATOR_SYSTEM_PROMPT),
+            HumanMessage(
+                content=_ORCHESTRATOR_HUMAN_TEMPLATE.format(
+                    risk_json=risk_json or json_dumps(state.risk_assessment, sort_keys=True),
+                    flight_json=summary["flight_json"],
+                )
+            ),
+        ]
 
     def _fallback_plan(self, state: DisruptionState, risk: Dict[str, Any]) -> Dict[str, Any]:
         logger.warning("⚠️ Orchestrator falling back to heuristic plan")
@@ -314,6 +717,8 @@ class OrchestratorAgent(LLMBackedAgent):
 class RiskAgent(LLMBackedAgent):
     """Risk assessment specialist agent."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__()
         self.name = "RiskAgent"
@@ -327,31 +732,46 @@ class RiskAgent(LLMBackedAgent):
         Returns:
             Updated state with enhanced risk assessment
         """
-        logger.info("⚠️  RISK AGENT (ADK): Assessing likelihood and impact...")
+        logger.info("⚠️  RISK AGENT (ADK): Assessing likelihood and impact...", extra={"agent": self.name, "event": "agent_start"})
         
-        risk_data = state.risk_assessment
-        prompt = self._risk_prompt(risk_data)
-        result = await self._invoke_llm_json(prompt)
+        draft = await self.draft(state)
+        result = await self._invoke_llm_json(self._risk_prompt(draft["risk_data"]))
+        return self.commit(state, draft, result)
+
+    async def draft(self, state: DisruptionState) -> Dict[str, Any]:
+        """Collect the inputs the LLM refinement step needs."""
+        return {"risk_data": state.risk_assessment}
+
+    def commit(
+        self,
+        state: DisruptionState,
+        draft: Dict[str, Any],
+        result: Dict[str, Any] | None,
+    ) -> DisruptionState:
+        """Validate the LLM refinement and write the assessment to state."""
+        risk_data = draft["risk_data"]
+        risk_prob = risk_data.get("risk_probability", _DEFAULT_RISK_PROBABILITY)
         
         # Validate LLM output for consistency
         if result:
-            risk_prob = risk_data.get("risk_probability", 0.75)
             llm_likelihood = result.get("likelihood", 0)
             
             # Check if LLM output contradicts input (>20% difference)
             if abs(llm_likelihood - risk_prob) > 0.2:
                 logger.warning(
-                    f"⚠️  Risk Agent LLM returned inconsistent likelihood: "
-                    f"{llm_likelihood:.2%} vs input {risk_prob:.2%} - using fallback"
+                    "⚠️  Risk Agent LLM returned inconsistent likelihood: "
+                    "%.2f%% vs input %.2f%% - using fallback",
+                    llm_likelihood * 100,
+                    risk_prob * 100,
                 )
                 result = None  # Force fallback
         
         if not result:
             result = {
-                "likelihood": risk_data.get("risk_probability", 0.75),
-                "duration_minutes": self._estimate_duration(risk_data),
-                "pax_impact": self._assess_pax_impact(risk_data),
-                "regulatory_risk": self._assess_regulatory_risk(risk_data),
+                "likelihood": risk_prob,
+                "duration_minutes": self._estimate_duration(risk_prob),
+                "pax_impact": self._assess_pax_impact(risk_prob),
+                "regulatory_risk": self._assess_regulatory_risk(risk_prob),
                 "reasoning": "Heuristic fallback risk assessment"
             }
         
@@ -368,60 +788,54 @@ class RiskAgent(LLMBackedAgent):
         )
         
         logger.info(
-            f"📊 Risk: Likelihood={result['likelihood']:.2%}, "
-            f"Duration={result['duration_minutes']}min, Impact={result['pax_impact']}"
+            "📊 Risk: Likelihood=%.2f%%, Duration=%smin, Impact=%s",
+            result["likelihood"] * 100,
+            result["duration_minutes"],
+            result["pax_impact"],
+            extra={
+                "agent": self.name,
+                "event": "agent_result",
+                "likelihood": result["likelihood"],
+                "duration_minutes": result["duration_minutes"],
+                "pax_impact": result["pax_impact"],
+            },
         )
         
         return state
     
-    def _estimate_duration(self, risk_data: Dict) -> int:
-        """Estimate disruption duration from risk data."""
-        risk_prob = risk_data.get("risk_probability", 0.5)
-        if risk_prob > 0.8:
-            return 240  # 4 hours
-        elif risk_prob > 0.6:
-            return 180  # 3 hours
-        else:
-            return 120  # 2 hours
+    @staticmethod
+    def _estimate_duration(risk_prob: float) -> int:
+        """Estimate disruption duration from the risk probability."""
+        return _DURATION_MINUTES[bisect_left(_DURATION_THRESHOLDS, risk_prob)]
     
-    def _assess_pax_impact(self, risk_data: Dict) -> str:
+    @staticmethod
+    def _assess_pax_impact(risk_prob: float) -> str:
         """Assess passenger impact severity."""
-        risk_prob = risk_data.get("risk_probability", 0.5)
-        if risk_prob > 0.7:
-            return "high"
-        elif risk_prob > 0.5:
-            return "medium"
-        else:
-            return "low"
+        return _PAX_IMPACT_LEVELS[bisect_left(_PAX_IMPACT_THRESHOLDS, risk_prob)]
     
-    def _assess_regulatory_risk(self, risk_data: Dict) -> str:
+    @staticmethod
+    def _assess_regulatory_risk(risk_prob: float) -> str:
         """Assess regulatory compliance risk."""
-        risk_prob = risk_data.get("risk_probability", 0.5)
         if risk_prob > 0.7:
             return "EU261/HKCAD compensation required"
         else:
             return "Monitor for compensation thresholds"
 
-    def _risk_prompt(self, risk_data: Dict[str, Any]) -> str:
-        return (
-            "You are an airline risk officer. Analyze the following risk snapshot "
-            "and provide a JSON payload that estimates likelihood, duration, "
-            "passenger impact, and regulatory exposure.\n\n"
-            f"Risk Data:\n{json.dumps(risk_data, indent=2)}\n\n"
-            "JSON schema:\n"
-            "{\n"
-            '  "likelihood": 0.0 - 1.0,\n'
-            '  "duration_minutes": int,\n'
-            '  "pax_impact": "low|medium|high",\n'
-            '  "regulatory_risk": "...",\n'
-            '  "reasoning": "..."\n'
-            "}"
-        )
+    def _risk_payload(self, risk_data: Dict[str, Any]) -> str:
+        return _RISK_HUMAN_TEMPLATE.format(risk_json=json_dumps(risk_data, sort_keys=True))
+
+    def _risk_prompt(self, risk_data: Dict[str, Any]) -> List[BaseMessage]:
+        return [
+            _system_message(_RISK_SYSTEM_PROMPT),
+            HumanMessage(content=self._risk_payload(risk_data)),
+        ]
 
 
 class RebookingAgent(LLMBackedAgent):
     """Passenger re-accommodation specialist agent."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__()
         self.name = "RebookingAgent"
@@ -435,67 +849,90 @@ class RebookingAgent(LLMBackedAgent):
         Returns:
             Updated state with rebooking plan
         """
-        logger.info("✈️  REBOOKING AGENT (ADK): Planning re-accommodation...")
+        logger.info("✈️  REBOOKING AGENT (ADK): Planning re-accommodation...", extra={"agent": self.name, "event": "agent_start"})
         
+        draft = await self.draft(state)
+        llm_plan = await self.refine(draft)
+        return self.commit(state, draft, llm_plan)
+
+    async def draft(self, state: DisruptionState) -> Dict[str, Any]:
+        """Run the rebooking tool and collect the LLM refinement inputs."""
         input_data = state.input_data
-        flights = input_data.get("flights", [])
         risk = state.risk_assessment
         
-        # Find critical flights
-        critical_flights = [f for f in flights if f.get("statusCategory") == "critical"]
+        # Critical flights come from the shared per-run summary
+        summary = get_flight_summary(state)
+        critical = summary["flights_by_status"].get("critical")
         
         # Estimate passenger count
-        pax_count = input_data.get("stats", {}).get("paxImpacted", 200)
-        delay_minutes = risk.get("duration_minutes", 120)
+        pax_count = (input_data.get("stats") or _NO_STATS).get("paxImpacted", _DEFAULT_PAX)
+        delay_minutes = risk.get("duration_minutes", _DEFAULT_DELAY_MINUTES)
         
         # Extract flight details for Amadeus API
         origin = input_data.get("airport", "HKG")
         
         # Try to extract destination from first critical flight
+        flight_id = "UNKNOWN"
         destination = "LAX"  # Default
         departure_date = None
         
-        if critical_flights:
-            first_flight = critical_flights[0]
+        if critical:
+            flight_id = critical.ids[0]
+            if flight_id is None:
+                flight_id = "CX888"
             # Try to extract destination from flight data
-            if "route" in first_flight:
-                destination = first_flight["route"].split("-")[-1].strip()
-            elif "destination" in first_flight:
-                destination = first_flight["destination"]
+            route = critical.routes[0]
+            if route:
+                destination = route.split("-")[-1].strip()
+            elif critical.destinations[0]:
+                destination = critical.destinations[0]
             
-            # Try to extract departure date
-            if "scheduledDeparture" in first_flight:
-                # Parse date from ISO format
-                from datetime import datetime
-                try:
-                    dt = datetime.fromisoformat(first_flight["scheduledDeparture"].replace("Z", "+00:00"))
-                    departure_date = dt.strftime("%Y-%m-%d")
-                except:
-                    pass
+            # The ISO timestamp's date prefix is the departure date; parsing
+            # it would not shift the day since no timezone conversion happens.
+            departure_date = _iso_date_prefix(critical.departures[0])
         
         # Use rebooking tool with flight details
         tool_plan = await rebooking_tool(
-            flight_id=critical_flights[0].get("id", "CX888") if critical_flights else "UNKNOWN",
+            flight_id=flight_id,
             pax_count=pax_count,
             delay_minutes=delay_minutes,
-            vip_count=int(pax_count * 0.1),  # Assume 10% VIPs
+            vip_count=int(
+                pax_count * _VIP_RATIO_BY_CARRIER.get(input_data.get("carrier"), _DEFAULT_VIP_RATIO)
+            ),
             disruption_type="delay",
             origin=origin,
             destination=destination,
             departure_date=departure_date
         )
         
-        prompt = self._rebooking_prompt(tool_plan, critical_flights)
-        llm_plan = await self._invoke_llm_json(prompt)
-        result = tool_plan.copy()
-        if llm_plan:
-            result.update({k: v for k, v in llm_plan.items() if v is not None})
+        return {
+            "tool_plan": tool_plan,
+            "first_critical": summary["first_critical"],
+            "critical_count": summary["critical_count"],
+            "pax_count": pax_count,
+        }
+
+    async def refine(self, draft: Dict[str, Any]) -> Dict[str, Any] | None:
+        """Ask the LLM to refine a drafted tool plan."""
+        return await self._invoke_llm_json(
+            self._rebooking_prompt(draft["tool_plan"], draft["first_critical"])
+        )
+
+    def commit(
+        self,
+        state: DisruptionState,
+        draft: Dict[str, Any],
+        llm_plan: Dict[str, Any] | None,
+    ) -> DisruptionState:
+        """Merge the LLM refinement over the tool plan and write it to state."""
+        pax_count = draft["pax_count"]
+        result = self._merge_nonnull(draft["tool_plan"], llm_plan)
         
         state.rebooking_plan = result
         state = log_reasoning(
             state,
             self.name,
-            {"pax_count": pax_count, "critical_flights": len(critical_flights)},
+            {"pax_count": pax_count, "critical_flights": draft["critical_count"]},
             result,
         )
         state = record_decision(
@@ -508,47 +945,96 @@ class RebookingAgent(LLMBackedAgent):
         )
         
         logger.info(
-            f"🎫 Rebooking: {result['strategy']}, "
-            f"Hotel={result['hotel_required']}, PAX={pax_count}"
+            "🎫 Rebooking: %s, Hotel=%s, PAX=%s",
+            result["strategy"],
+            result["hotel_required"],
+            pax_count,
+            extra={
+                "agent": self.name,
+                "event": "agent_result",
+                "strategy": result["strategy"],
+                "hotel_required": result["hotel_required"],
+                "pax_count": pax_count,
+            },
         )
         
         return state
 
-    def _rebooking_prompt(self, tool_plan: Dict[str, Any], flights: List[Dict[str, Any]]) -> str:
-        sample = flights[0] if flights else {}
-        return (
-            "You are the passenger disruption lead. Refine the draft rebooking plan "
-            "generated by our tools and ensure the output stays in JSON.\n\n"
-            f"Tool Plan:\n{json.dumps(tool_plan, indent=2)}\n\n"
-            f"Sample Critical Flight:\n{json.dumps(sample, indent=2)}\n\n"
-            "Return JSON with the same fields (strategy, hotel_required, vip_priority, "
-            "estimated_pax, vip_count, delay_minutes, actions, reasoning)."
+    def _rebooking_payload(
+        self, tool_plan: Dict[str, Any], sample: Dict[str, Any] | None
+    ) -> str:
+        return _REBOOKING_HUMAN_TEMPLATE.format(
+            plan_json=json_dumps(tool_plan, sort_keys=True),
+            sample_json=json_dumps(sample or {}, sort_keys=True),
         )
 
+    def _rebooking_prompt(
+        self, tool_plan: Dict[str, Any], sample: Dict[str, Any] | None
+    ) -> List[BaseMessage]:
+        return [
+            _system_message(_REBOOKING_SYSTEM_PROMPT),
+            HumanMessage(content=self._rebooking_payload(tool_plan, sample)),
+        ]
+
 
 class FinanceAgent(LLMBackedAgent):
     """Financial impact assessment agent."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__()
         self.name = "FinanceAgent"
     
-    async def run(self, state: DisruptionState) -> DisruptionState:
+    async def run(
+        self,
+        state: DisruptionState,
+        refine: bool = True,
+        pre_estimate: Dict[str, Any] | None = None,
+    ) -> DisruptionState:
         """Calculate financial impact of disruption.
         
         Args:
             state: Current disruption state
+            refine: Whether to ask the LLM to review the tool estimate
+            pre_estimate: Draft priced from the rebooking tool plan while the
+                rebooking LLM was still running; reused when the final plan
+                kept the same passenger count and hotel decision
             
         Returns:
             Updated state with finance estimate
         """
-        logger.info("💰 FINANCE AGENT (ADK): Calculating costs...")
+        logger.info("💰 FINANCE AGENT (ADK): Calculating costs...", extra={"agent": self.name, "event": "agent_start"})
         
         rebooking = state.rebooking_plan
+        if pre_estimate is not None and self._same_pricing(pre_estimate["rebooking"], rebooking):
+            draft = {**pre_estimate, "rebooking": rebooking}
+        else:
+            draft = await self.draft(state)
+        llm_estimate = None
+        if refine:
+            llm_estimate = await self._invoke_llm_json(
+                self._finance_prompt(draft["tool_estimate"], draft["risk"], draft["rebooking"])
+            )
+        return self.commit(state, draft, llm_estimate)
+
+    async def draft(
+        self,
+        state: DisruptionState,
+        rebooking: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any]:
+        """Run the finance tool and collect the LLM refinement inputs.
+        
+        Args:
+            state: Current disruption state
+            rebooking: Rebooking plan to price; defaults to the one on state
+        """
+        if rebooking is None:
+            rebooking = state.rebooking_plan
         risk = state.risk_assessment
         
-        pax_count = rebooking.get("estimated_pax", 200)
-        delay_minutes = risk.get("duration_minutes", 120)
+        pax_count = rebooking.get("estimated_pax", _DEFAULT_PAX)
+        delay_minutes = risk.get("duration_minutes", _DEFAULT_DELAY_MINUTES)
         hotel_required = rebooking.get("hotel_required", False)
         
         # Use finance tool
@@ -559,16 +1045,28 @@ class FinanceAgent(LLMBackedAgent):
             flight_distance="medium"
         )
         
-        prompt = self._finance_prompt(tool_estimate, risk, rebooking)
-        llm_estimate = await self._invoke_llm_json(prompt)
-        result = tool_estimate.copy()
+        return {
+            "tool_estimate": tool_estimate,
+            "risk": risk,
+            "rebooking": rebooking,
+            "pax_count": pax_count,
+        }
+
+    def commit(
+        self,
+        state: DisruptionState,
+        draft: Dict[str, Any],
+        llm_estimate: Dict[str, Any] | None,
+    ) -> DisruptionState:
+        """Attach the LLM commentary to the tool estimate and write it to state."""
+        result = draft["tool_estimate"].copy()
         if llm_estimate:
             reasoning = llm_estimate.get("reasoning")
             if reasoning is not None:
                 result["reasoning"] = reasoning
         
         state.finance_estimate = result
-        state = log_reasoning(state, self.name, {"pax_count": pax_count}, result)
+        state = log_reasoning(state, self.name, {"pax_count": draft["pax_count"]}, result)
         state = record_decision(
             state,
             self.name,
@@ -578,11 +1076,23 @@ class FinanceAgent(LLMBackedAgent):
             data=result,
         )
         
-        logger.info(f"💵 Total Cost: ${result['total_usd']:,}")
+        logger.info(
+            "💵 Total Cost: $%s",
+            _Thousands(result["total_usd"]),
+            extra={"agent": self.name, "event": "agent_result", "total_usd": result["total_usd"]},
+        )
         
         return state
 
-    def _finance_prompt(
+    @staticmethod
+    def _same_pricing(priced: Dict[str, Any], rebooking: Dict[str, Any]) -> bool:
+        """Whether ``rebooking`` changes none of the finance tool inputs."""
+        return (
+            priced.get("estimated_pax", _DEFAULT_PAX) == rebooking.get("estimated_pax", _DEFAULT_PAX)
+            and priced.get("hotel_required", False) == rebooking.get("hotel_required", False)
+        )
+
+    def _finance_payload(
         self,
         tool_estimate: Dict[str, Any],
         risk: Dict[str, Any],
@@ -593,38 +1103,52 @@ class FinanceAgent(LLMBackedAgent):
             "risk": risk,
             "rebooking": rebooking,
         }
-        return (
-            "You are an airline finance controller. Cross-check the disruption "
-            "estimate from our deterministic tool and adjust if needed. Keep the "
-            "same JSON keys (compensation_usd, hotel_meals_usd, operational_usd, "
-            "total_usd, breakdown, reasoning).\n\n"
-            f"Context:\n{json.dumps(payload, indent=2)}"
-        )
+        return _FINANCE_HUMAN_TEMPLATE.format(context_json=json_dumps(payload, sort_keys=True))
+
+    def _finance_prompt(
+        self,
+        tool_estimate: Dict[str, Any],
+        risk: Dict[str, Any],
+        rebooking: Dict[str, Any],
+    ) -> List[BaseMessage]:
+        return [
+            _system_message(_FINANCE_SYSTEM_PROMPT),
+            HumanMessage(content=self._finance_payload(tool_estimate, risk, rebooking)),
+        ]
 
 
 class CrewAgent(LLMBackedAgent):
     """Crew scheduling and management agent."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__()
         self.name = "CrewAgent"
     
-    async def run(self, state: DisruptionState) -> DisruptionState:
+    async def run(self, state: DisruptionState, refine: bool = True) -> DisruptionState:
         """Assess crew scheduling impacts.
         
         Args:
             state: Current disruption state
+            refine: Whether to ask the LLM to review the tool plan
             
         Returns:
             Updated state with crew rotation plan
         """
-        logger.info("👥 CREW AGENT (ADK): Managing crew schedules...")
+        logger.info("👥 CREW AGENT (ADK): Managing crew schedules...", extra={"agent": self.name, "event": "agent_start"})
         
-        input_data = state.input_data
+        draft = await self.draft(state)
+        llm_plan = await self.refine(draft) if refine else None
+        return self.commit(state, draft, llm_plan)
+
+    async def draft(self, state: DisruptionState) -> Dict[str, Any]:
+        """Run the crew scheduling tool and collect the LLM refinement inputs."""
+        summary = get_flight_summary(state)
         risk = state.risk_assessment
         
-        flight_count = len(input_data.get("flights", []))
-        delay_minutes = risk.get("duration_minutes", 120)
+        flight_count = summary["flight_count"]
+        delay_minutes = risk.get("duration_minutes", _DEFAULT_DELAY_MINUTES)
         
         # Use crew scheduling tool
         tool_plan = await crew_scheduling_tool(
@@ -633,14 +1157,29 @@ class CrewAgent(LLMBackedAgent):
             crew_available=10
         )
         
-        prompt = self._crew_prompt(tool_plan, input_data)
-        llm_plan = await self._invoke_llm_json(prompt)
-        result = tool_plan.copy()
-        if llm_plan:
-            result.update({k: v for k, v in llm_plan.items() if v is not None})
+        return {
+            "tool_plan": tool_plan,
+            "flight_count": flight_count,
+            "stats_json": summary["stats_json"],
+        }
+
+    async def refine(self, draft: Dict[str, Any]) -> Dict[str, Any] | None:
+        """Ask the LLM to refine a drafted tool plan."""
+        return await self._invoke_llm_json(
+            self._crew_prompt(draft["tool_plan"], draft["stats_json"])
+        )
+
+    def commit(
+        self,
+        state: DisruptionState,
+        draft: Dict[str, Any],
+        llm_plan: Dict[str, Any] | None,
+    ) -> DisruptionState:
+        """Merge the LLM refinement over the tool plan and write it to state."""
+        result = self._merge_nonnull(draft["tool_plan"], llm_plan)
         
         state.crew_rotation = result
-        state = log_reasoning(state, self.name, {"flights": flight_count}, result)
+        state = log_reasoning(state, self.name, {"flights": draft["flight_count"]}, result)
         state = record_decision(
             state,
             self.name,
@@ -651,26 +1190,137 @@ class CrewAgent(LLMBackedAgent):
         )
         
         logger.info(
-            f"👔 Crew: Changes={'Required' if result['crew_changes_needed'] else 'Not needed'}, "
-            f"Backup={result['backup_crew_required']}"
+            "👔 Crew: Changes=%s, Backup=%s",
+            "Required" if result["crew_changes_needed"] else "Not needed",
+            result["backup_crew_required"],
+            extra={
+                "agent": self.name,
+                "event": "agent_result",
+                "crew_changes_needed": result["crew_changes_needed"],
+                "backup_crew_required": result["backup_crew_required"],
+            },
         )
         
         return state
 
-    def _crew_prompt(self, tool_plan: Dict[str, Any], input_data: Dict[str, Any]) -> str:
-        return (
-            "You are a crew scheduling expert reviewing system recommendations. "
-            "Adjust the JSON plan if needed while preserving the same keys "
-            "(crew_changes_needed, backup_crew_required, regulatory_issues, "
-            "actions, reasoning).\n\n"
-            f"Tool Recommendation:\n{json.dumps(tool_plan, indent=2)}\n\n"
-            f"Flight Stats:\n{json.dumps(input_data.get('stats', {}), indent=2)}"
+    def _crew_payload(self, tool_plan: Dict[str, Any], stats_json: str) -> str:
+        return _CREW_HUMAN_TEMPLATE.format(
+            plan_json=json_dumps(tool_plan, sort_keys=True),
+            stats_json=stats_json,
         )
 
+    def _crew_prompt(self, tool_plan: Dict[str, Any], stats_json: str) -> List[BaseMessage]:
+        return [
+            _system_message(_CREW_SYSTEM_PROMPT),
+            HumanMessage(content=self._crew_payload(tool_plan, stats_json)),
+        ]
+
+
+class SubAgentBatch(LLMBackedAgent):
+    """Runs the risk, rebooking, finance and crew agents with one LLM call.
+    
+    Each agent still runs its deterministic tool and its own merge logic;
+    only the four refinement prompts are folded into a single request that
+    returns one JSON object keyed by agent. Finance prices the rebooking
+    tool plan, since the refined plan is not known until the reply arrives.
+    """
+    
+    __slots__ = ("risk_agent", "rebooking_agent", "finance_agent", "crew_agent")
+    
+    def __init__(
+        self,
+        risk_agent: RiskAgent,
+        rebooking_agent: RebookingAgent,
+        finance_agent: FinanceAgent,
+        crew_agent: CrewAgent,
+    ):
+        super().__init__()
+        self.name = "SubAgentBatch"
+        self.risk_agent = risk_agent
+        self.rebooking_agent = rebooking_agent
+        self.finance_agent = finance_agent
+        self.crew_agent = crew_agent
+    
+    async def run(self, state: DisruptionState) -> DisruptionState:
+        """Draft all four plans, refine them together, then commit each.
+        
+        Args:
+            state: Current disruption state
+            
+        Returns:
+            Updated state with risk, rebooking, finance and crew outputs
+        """
+        logger.info("🧩 SUB-AGENT BATCH (ADK): Running combined refinement...", extra={"agent": self.name, "event": "agent_start"})
+        
+        risk_draft, rebooking_draft, crew_draft = await asyncio.gather(
+            self.risk_agent.draft(state),
+            self.rebooking_agent.draft(state),
+            self.crew_agent.draft(state),
+        )
+        finance_draft = await self.finance_agent.draft(
+            state, rebooking=rebooking_draft["tool_plan"]
+        )
+        
+        output = await self._invoke_llm_json(
+            self._batch_prompt(risk_draft, rebooking_draft, finance_draft, crew_draft)
+        ) or {}
+        
+        state = self.risk_agent.commit(state, risk_draft, self._section(output, "risk"))
+        state = self.rebooking_agent.commit(
+            state, rebooking_draft, self._section(output, "rebooking")
+        )
+        state = self.finance_agent.commit(
+            state, finance_draft, self._section(output, "finance")
+        )
+        state = self.crew_agent.commit(state, crew_draft, self._section(output, "crew"))
+        return state
+
+    @staticmethod
+    def _section(output: Dict[str, Any], key: str) -> Dict[str, Any] | None:
+        section = output.get(key)
+        return section if isinstance(section, dict) else None
+
+    def _batch_prompt(
+        self,
+        risk_draft: Dict[str, Any],
+        rebooking_draft: Dict[str, Any],
+        finance_draft: Dict[str, Any],
+        crew_draft: Dict[str, Any],
+    ) -> List[BaseMessage]:
+        sections = [
+            ("risk", self.risk_agent._risk_payload(risk_draft["risk_data"])),
+            (
+                "rebooking",
+                self.rebooking_agent._rebooking_payload(
+                    rebooking_draft["tool_plan"], rebooking_draft["first_critical"]
+                ),
+            ),
+            (
+                "finance",
+                self.finance_agent._finance_payload(
+                    finance_draft["tool_estimate"],
+                    finance_draft["risk"],
+                    finance_draft["rebooking"],
+                ),
+            ),
+            (
+                "crew",
+                self.crew_agent._crew_payload(crew_draft["tool_plan"], crew_draft["stats_json"]),
+            ),
+        ]
+        return [
+            _system_message(_BATCH_SYSTEM_PROMPT),
+            HumanMessage(
+                content="\n\n".join(f"## {key}\n{payload}" for key, payload in sections)
+            ),
+        ]
+
 
 class AggregatorAgent:
     """Aggregator agent for synthesizing all outputs."""
     
+    __slots__ = ("name",)
+    
     def __init__(self):
         self.name = "AggregatorAgent"
     
@@ -683,8 +1333,9 @@ class AggregatorAgent:
         Returns:
             Updated state with final plan
         """
-        logger.info("📋 AGGREGATOR AGENT (ADK): Synthesizing final plan...")
+        logger.info("📋 AGGREGATOR AGENT (ADK): Synthesizing final plan...", extra={"agent": self.name, "event": "agent_start"})
         
+        risk_likelihood = state.risk_assessment.get("likelihood", 0)
         final_plan = {
             "disruption_detected": state.disruption_detected,
             "risk_assessment": state.risk_assessment,
@@ -694,22 +1345,22 @@ class AggregatorAgent:
             "crew_rotation": state.crew_rotation,
             "recommended_action": "PROCEED" if state.disruption_detected else "MONITOR",
             "confidence": "high" if len(state.audit_log) > 5 else "medium",
-            "generated_at": state.audit_log[-1]["timestamp"] if state.audit_log else None,
+            "generated_at": state.audit_log[-1].get("timestamp") if state.audit_log else None,
             "decision_count": len(state.decision_log),
+            "priority": _PRIORITY_LEVELS[bisect_left(_PRIORITY_THRESHOLDS, risk_likelihood)],
         }
         
-        # Calculate priority
-        risk_likelihood = state.risk_assessment.get("likelihood", 0)
-        if risk_likelihood > 0.8:
-            final_plan["priority"] = "critical"
-        elif risk_likelihood > 0.6:
-            final_plan["priority"] = "high"
-        else:
-            final_plan["priority"] = "medium"
-        
-        state.simulation_results = self._render_scenarios(state)
+        state.simulation_results = _render_scenarios(state)
         state.final_plan = final_plan
-        state = log_reasoning(state, self.name, state.simulation_results, final_plan)
+        # The risk, rebooking, finance and crew plans, and the decisions the
+        # scenarios are built from, are already in the audit log under the
+        # agents that produced them; only the aggregator's own verdict is new.
+        state = log_reasoning(
+            state,
+            self.name,
+            {"scenarios": [scenario.get("scenario") for scenario in state.simulation_results]},
+            {key: final_plan[key] for key in _AGGREGATE_AUDIT_KEYS},
+        )
         state = record_decision(
             state,
             self.name,
@@ -720,58 +1371,16 @@ class AggregatorAgent:
         )
         
         logger.info(
-            f"✅ Final Plan: Priority={final_plan['priority']}, "
-            f"Action={final_plan['recommended_action']}"
+            "✅ Final Plan: Priority=%s, Action=%s",
+            final_plan["priority"],
+            final_plan["recommended_action"],
+            extra={
+                "agent": self.name,
+                "event": "agent_result",
+                "priority": final_plan["priority"],
+                "recommended_action": final_plan["recommended_action"],
+            },
         )
         
         return state
 
-    def _render_scenarios(self, state: DisruptionState) -> List[Dict[str, Any]]:
-        templates = state.what_if_templates or self._default_templates(state)
-        rendered = []
-        for template in templates:
-            scenario_key = template.get("scenario") or template.get("name") or "unknown"
-            plan = template.get("plan", template.get("details", {}))
-            relevant = [
-                decision
-                for decision in state.decision_log
-                if "global" in decision.get("scenarios", [])
-                or scenario_key in decision.get("scenarios", [])
-            ]
-            rendered.append(
-                {
-                    "scenario": scenario_key,
-                    "plan": plan,
-                    "summary": template.get("description") or plan.get("description"),
-                    "agent_decisions": relevant,
-                }
-            )
-        return rendered
-
-    def _default_templates(self, state: DisruptionState) -> List[Dict[str, Any]]:
-        return [
-            {
-                "scenario": "delay_3hr",
-                "description": "Extended delay beyond three hours",
-                "plan": {
-                    "description": "Issue EU261/HKCAD support",
-                    "actions": [
-                        "Deploy hotel vouchers",
-                        "Send proactive comms",
-                        "Coordinate with finance for extra budget",
-                    ],
-                },
-            },
-            {
-                "scenario": "crew_unavailable",
-                "description": "Relief crew cannot report in time",
-                "plan": {
-                    "description": "Trigger crew contingency roster",
-                    "actions": [
-                        "Activate reserve crew",
-                        "Re-sequence departures",
-                        "Notify rostering control",
-                    ],
-                },
-            },
-        ]
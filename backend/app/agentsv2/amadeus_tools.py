@@ -4,16 +4,137 @@ These tools enable agents to search flights, hotels, and create bookings
 using real Amadeus data instead of synthetic data.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 from ..services.amadeus_client import get_amadeus_client, AmadeusAPIError
 from ..config import settings
+from .cache import async_ttl_cache
 
 
 logger = logging.getLogger(__name__)
 
+_SEARCH_CACHE_SIZE = 512
+
+# IATA metropolitan city codes for airports whose code differs from their
+# city's; hotel search is by city. Airports not listed are their own city.
+_AIRPORT_CITY_CODES: Mapping[str, str] = MappingProxyType({
+    "NRT": "TYO", "HND": "TYO",
+    "KIX": "OSA", "ITM": "OSA",
+    "ICN": "SEL", "GMP": "SEL",
+    "PEK": "BJS", "PKX": "BJS",
+    "PVG": "SHA",
+    "TSA": "TPE",
+    "DMK": "BKK",
+    "CGK": "JKT",
+    "LHR": "LON", "LGW": "LON", "STN": "LON", "LCY": "LON",
+    "CDG": "PAR", "ORY": "PAR",
+    "MXP": "MIL", "LIN": "MIL",
+    "FCO": "ROM",
+    "ARN": "STO",
+    "JFK": "NYC", "EWR": "NYC", "LGA": "NYC",
+    "ORD": "CHI",
+    "IAD": "WAS", "DCA": "WAS",
+    "YYZ": "YTO",
+    "YUL": "YMQ",
+    "GRU": "SAO",
+})
+
+# Contact shared by every mock traveler; the order request only serializes it.
+_MOCK_PHONES = [{"deviceType": "MOBILE", "countryCallingCode": "852", "number": "12345678"}]
+
+
+def _search_cache_key(*args: Any) -> tuple:
+    return args
+
+
+def _has_results(results: List[Dict[str, Any]]) -> bool:
+    # The client reports API errors as an empty list, so empty answers are
+    # retried rather than cached.
+    return bool(results)
+
+
+@async_ttl_cache(
+    maxsize=_SEARCH_CACHE_SIZE,
+    ttl=settings.amadeus_search_cache_ttl,
+    key=_search_cache_key,
+    cache_if=_has_results,
+)
+async def _flight_offers(
+    origin: str,
+    destination: str,
+    departure_date: str,
+    adults: int,
+    max_results: int,
+) -> List[Dict[str, Any]]:
+    return await get_amadeus_client().search_flight_offers(
+        origin=origin,
+        destination=destination,
+        departure_date=departure_date,
+        adults=adults,
+        max_results=max_results,
+        currency="USD",
+        non_stop=False
+    )
+
+
+@async_ttl_cache(
+    maxsize=_SEARCH_CACHE_SIZE,
+    ttl=settings.amadeus_search_cache_ttl,
+    key=_search_cache_key,
+    cache_if=_has_results,
+)
+async def _hotel_offers(
+    city_code: str,
+    check_in_date: str,
+    check_out_date: str,
+    adults: int,
+    rooms: int,
+    max_results: int,
+) -> List[Dict[str, Any]]:
+    return await get_amadeus_client().search_hotels(
+        city_code=city_code,
+        check_in_date=check_in_date,
+        check_out_date=check_out_date,
+        adults=adults,
+        rooms=rooms,
+        max_results=max_results
+    )
+
+
+def invalidate_search_cache() -> None:
+    """Drop cached flight and hotel search results (e.g. after a booking)."""
+    _flight_offers.cache.clear()
+    _hotel_offers.cache.clear()
+
+
+def _empty_flight_result(
+    error: str, search_params: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    """Flight search result with no alternatives and the reason why."""
+    return {
+        "alternatives": [],
+        "count": 0,
+        "search_params": search_params or {},
+        "error": error
+    }
+
+
+def _empty_hotel_result(
+    error: str, search_params: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    """Hotel search result with no hotels and the reason why."""
+    return {
+        "hotels": [],
+        "count": 0,
+        "total_cost": 0,
+        "search_params": search_params or {},
+        "error": error
+    }
+
 
 async def search_alternative_flights_tool(
     origin: str,
@@ -45,45 +166,51 @@ async def search_alternative_flights_tool(
         client = get_amadeus_client()
         
         logger.info(
-            f"🔍 Searching alternative flights: {origin} → {destination} "
-            f"on {departure_date} for {passenger_count} pax"
+            "🔍 Searching alternative flights: %s → %s on %s for %d pax",
+            origin, destination, departure_date, passenger_count,
         )
         
-        # Search for flight offers
-        offers = await client.search_flight_offers(
-            origin=origin,
-            destination=destination,
-            departure_date=departure_date,
-            adults=min(passenger_count, 9),  # Amadeus API limit per search
-            max_results=max_results,
-            currency="USD",
-            non_stop=False
+        # Search for flight offers; identical searches within
+        # AMADEUS_SEARCH_CACHE_TTL share one API call
+        offers = await _flight_offers(
+            origin,
+            destination,
+            departure_date,
+            min(passenger_count, 9),  # Amadeus API limit per search
+            max_results,
         )
         
         if not offers:
-            return {
-                "alternatives": [],
-                "count": 0,
-                "search_params": {
+            return _empty_flight_result(
+                "No alternative flights found",
+                {
                     "origin": origin,
                     "destination": destination,
                     "date": departure_date,
                     "passengers": passenger_count
                 },
-                "error": "No alternative flights found"
-            }
+            )
         
-        # Parse and simplify offers
+        # Parse and simplify offers, tracking the price range as we go. The
+        # API's "max" is only a request, so stop once enough have parsed.
         alternatives = []
+        low_price = high_price = None
         for offer in offers:
+            if len(alternatives) >= max_results:
+                break
             parsed = client.parse_flight_offer(offer)
             if parsed:
                 alternatives.append({
                     **parsed,
                     "raw_offer": offer  # Keep raw offer for booking
                 })
+                price = parsed["price"]["total"]
+                if low_price is None or price < low_price:
+                    low_price = price
+                if high_price is None or price > high_price:
+                    high_price = price
         
-        logger.info(f"✅ Found {len(alternatives)} alternative flights")
+        logger.info("✅ Found %d alternative flights", len(alternatives))
         
         return {
             "alternatives": alternatives,
@@ -96,27 +223,17 @@ async def search_alternative_flights_tool(
             },
             "reasoning": (
                 f"Located {len(alternatives)} alternative flight options "
-                f"with prices ranging from ${min(a['price']['total'] for a in alternatives):.2f} "
-                f"to ${max(a['price']['total'] for a in alternatives):.2f}"
+                f"with prices ranging from ${low_price:.2f} "
+                f"to ${high_price:.2f}"
             )
         }
         
     except AmadeusAPIError as e:
-        logger.error(f"Amadeus API error: {e}")
-        return {
-            "alternatives": [],
-            "count": 0,
-            "search_params": {},
-            "error": str(e)
-        }
+        logger.error("Amadeus API error: %s", e)
+        return _empty_flight_result(str(e))
     except Exception as e:
-        logger.error(f"Unexpected error searching flights: {e}", exc_info=True)
-        return {
-            "alternatives": [],
-            "count": 0,
-            "search_params": {},
-            "error": f"Unexpected error: {str(e)}"
-        }
+        logger.error("Unexpected error searching flights: %s", e, exc_info=True)
+        return _empty_flight_result(f"Unexpected error: {str(e)}")
 
 
 async def search_hotels_tool(
@@ -151,36 +268,33 @@ async def search_hotels_tool(
         client = get_amadeus_client()
         
         logger.info(
-            f"🏨 Searching hotels in {city_code}: "
-            f"{check_in_date} to {check_out_date}, {room_count} rooms"
+            "🏨 Searching hotels in %s: %s to %s, %d rooms",
+            city_code, check_in_date, check_out_date, room_count,
         )
         
         # Calculate adults per room
         adults_per_room = max(1, passenger_count // room_count)
         
-        # Search for hotels
-        hotels = await client.search_hotels(
-            city_code=city_code,
-            check_in_date=check_in_date,
-            check_out_date=check_out_date,
-            adults=adults_per_room,
-            rooms=room_count,
-            max_results=max_results
+        # Search for hotels (cached like the flight search)
+        hotels = await _hotel_offers(
+            city_code,
+            check_in_date,
+            check_out_date,
+            adults_per_room,
+            room_count,
+            max_results,
         )
         
         if not hotels:
-            return {
-                "hotels": [],
-                "count": 0,
-                "total_cost": 0,
-                "search_params": {
+            return _empty_hotel_result(
+                "No hotels found",
+                {
                     "city": city_code,
                     "check_in": check_in_date,
                     "check_out": check_out_date,
                     "rooms": room_count
                 },
-                "error": "No hotels found"
-            }
+            )
         
         # Parse hotel offers
         parsed_hotels = []
@@ -198,8 +312,8 @@ async def search_hotels_tool(
                 parsed_hotels.append(parsed)
         
         logger.info(
-            f"✅ Found {len(parsed_hotels)} hotels, "
-            f"estimated cost: ${total_cost:.2f}"
+            "✅ Found %d hotels, estimated cost: $%.2f",
+            len(parsed_hotels), total_cost,
         )
         
         return {
@@ -220,23 +334,11 @@ async def search_hotels_tool(
         }
         
     except AmadeusAPIError as e:
-        logger.error(f"Amadeus API error: {e}")
-        return {
-            "hotels": [],
-            "count": 0,
-            "total_cost": 0,
-            "search_params": {},
-            "error": str(e)
-        }
+        logger.error("Amadeus API error: %s", e)
+        return _empty_hotel_result(str(e))
     except Exception as e:
-        logger.error(f"Unexpected error searching hotels: {e}", exc_info=True)
-        return {
-            "hotels": [],
-            "count": 0,
-            "total_cost": 0,
-            "search_params": {},
-            "error": f"Unexpected error: {str(e)}"
-        }
+        logger.error("Unexpected error searching hotels: %s", e, exc_info=True)
+        return _empty_hotel_result(f"Unexpected error: {str(e)}")
 
 
 async def book_flight_tool(
@@ -269,8 +371,8 @@ async def book_flight_tool(
         raw_offer = flight_offer.get("raw_offer", flight_offer)
         
         logger.info(
-            f"📝 Attempting to book flight {flight_offer.get('flight_number', 'N/A')} "
-            f"for {passenger_count} passengers"
+            "📝 Attempting to book flight %s for %d passengers",
+            flight_offer.get("flight_number", "N/A"), passenger_count,
         )
         
         # Step 1: Confirm pricing
@@ -285,25 +387,21 @@ async def book_flight_tool(
         # Step 2: Prepare traveler data
         # In production, this would come from passenger manifest
         # For now, create mock travelers
-        travelers = passenger_details or []
-        if not travelers:
-            for i in range(min(passenger_count, 9)):  # API limit
-                travelers.append({
-                    "id": str(i + 1),
-                    "dateOfBirth": "1990-01-01",
-                    "name": {
-                        "firstName": f"PASSENGER{i+1}",
-                        "lastName": "DOE"
-                    },
-                    "contact": {
-                        "emailAddress": f"passenger{i+1}@cathay.com",
-                        "phones": [{
-                            "deviceType": "MOBILE",
-                            "countryCallingCode": "852",
-                            "number": "12345678"
-                        }]
-                    }
-                })
+        travelers = passenger_details or [
+            {
+                "id": str(i),
+                "dateOfBirth": "1990-01-01",
+                "name": {
+                    "firstName": f"PASSENGER{i}",
+                    "lastName": "DOE"
+                },
+                "contact": {
+                    "emailAddress": f"passenger{i}@cathay.com",
+                    "phones": _MOCK_PHONES
+                }
+            }
+            for i in range(1, min(passenger_count, 9) + 1)  # API limit
+        ]
         
         # Step 3: Create booking
         order = await client.create_flight_order(priced_offer, travelers)
@@ -314,11 +412,17 @@ async def book_flight_tool(
                 "error": "Failed to create flight booking"
             }
         
+        # The booking consumed inventory, so later searches must see fresh
+        # availability and prices
+        invalidate_search_cache()
+        
         # Extract booking details
-        pnr = order.get("associatedRecords", [{}])[0].get("reference", "N/A")
+        records = order.get("associatedRecords")
+        pnr = records[0].get("reference", "N/A") if records else "N/A"
+        price = priced_offer.get("price") or {}
         flight_number = flight_offer.get("flight_number", "N/A")
         
-        logger.info(f"✅ Flight booked successfully: PNR={pnr}")
+        logger.info("✅ Flight booked successfully: PNR=%s", pnr)
         
         return {
             "success": True,
@@ -328,8 +432,8 @@ async def book_flight_tool(
                 "order_id": order.get("id"),
                 "booking_date": datetime.now().isoformat(),
                 "passengers_booked": len(travelers),
-                "total_price": priced_offer.get("price", {}).get("total"),
-                "currency": priced_offer.get("price", {}).get("currency")
+                "total_price": price.get("total"),
+                "currency": price.get("currency")
             },
             "reasoning": (
                 f"Successfully booked flight {flight_number} for {len(travelers)} passengers. "
@@ -338,19 +442,38 @@ async def book_flight_tool(
         }
         
     except AmadeusAPIError as e:
-        logger.error(f"Amadeus booking error: {e}")
+        logger.error("Amadeus booking error: %s", e)
         return {
             "success": False,
             "error": str(e)
         }
     except Exception as e:
-        logger.error(f"Unexpected error during booking: {e}", exc_info=True)
+        logger.error("Unexpected error during booking: %s", e, exc_info=True)
         return {
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }
 
 
+def _search_result(
+    result: Dict[str, Any] | BaseException,
+    kind: str,
+    empty_result: Callable[[str], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Unwrap one ``asyncio.gather`` result, turning a failure into an empty result.
+    
+    The search tools report API errors in their result already; this only
+    catches what escapes them, so one failed search does not discard the
+    other.
+    """
+    if isinstance(result, BaseException):
+        if not isinstance(result, Exception):
+            raise result
+        logger.error("Unexpected error searching %s: %s", kind, result, exc_info=result)
+        return empty_result(f"Unexpected error: {result}")
+    return result
+
+
 async def comprehensive_reaccommodation_tool(
     origin: str,
     destination: str,
@@ -362,9 +485,9 @@ async def comprehensive_reaccommodation_tool(
     """Comprehensive re-accommodation tool combining flights and hotels.
     
     This high-level tool orchestrates the complete re-accommodation process:
-    1. Search for alternative flights
-    2. If overnight stay needed, search for hotels
-    3. Return complete re-accommodation plan
+    1. Search for alternative flights and, if an overnight stay is needed,
+       hotels (both searches run concurrently)
+    2. Return complete re-accommodation plan
     
     Args:
         origin: Origin airport code
@@ -383,8 +506,8 @@ async def comprehensive_reaccommodation_tool(
     """
     try:
         logger.info(
-            f"🎯 Comprehensive re-accommodation: {origin}→{destination}, "
-            f"{passenger_count} pax, {delay_minutes}min delay"
+            "🎯 Comprehensive re-accommodation: %s→%s, %d pax, %dmin delay",
+            origin, destination, passenger_count, delay_minutes,
         )
         
         # Determine new departure date based on delay
@@ -397,41 +520,52 @@ async def comprehensive_reaccommodation_tool(
             new_departure_date = original_departure_date
             needs_hotel = False
         
-        # Step 1: Search alternative flights
-        flight_results = await search_alternative_flights_tool(
-            origin=origin,
-            destination=destination,
-            departure_date=new_departure_date,
-            passenger_count=passenger_count,
-            max_results=5
-        )
-        
-        hotel_results = None
-        total_cost = 0
-        
-        # Step 2: Search hotels if needed
-        if needs_hotel and flight_results["count"] > 0:
+        # Steps 1 + 2: Search alternative flights and, for overnight delays,
+        # hotels. The hotel search only needs the dates and the destination,
+        # so both Amadeus round-trips are issued together.
+        searches = [
+            search_alternative_flights_tool(
+                origin=origin,
+                destination=destination,
+                departure_date=new_departure_date,
+                passenger_count=passenger_count,
+                max_results=5
+            )
+        ]
+        if needs_hotel:
             # Estimate room count (2 passengers per room)
             room_count = max(1, passenger_count // 2)
             
-            # Get city code from destination
-            city_code = destination[:3] if len(destination) > 3 else destination
+            # Hotels are searched by the destination's city
+            city_code = _AIRPORT_CITY_CODES.get(destination, destination[:3])
             
-            hotel_results = await search_hotels_tool(
+            searches.append(search_hotels_tool(
                 city_code=city_code,
                 check_in_date=original_departure_date,
                 check_out_date=new_departure_date,
                 room_count=room_count,
                 passenger_count=passenger_count,
                 max_results=3
-            )
-            
+            ))
+        
+        results = await asyncio.gather(*searches, return_exceptions=True)
+        flight_results = _search_result(results[0], "flights", _empty_flight_result)
+        
+        hotel_results = None
+        total_cost = 0
+        
+        # Hotels are only offered alongside a rebooking; the speculative
+        # search is dropped when no alternative flight was found.
+        if needs_hotel and flight_results["count"] > 0:
+            hotel_results = _search_result(results[1], "hotels", _empty_hotel_result)
             if hotel_results["count"] > 0:
                 total_cost += hotel_results["total_cost"]
         
+        best_flight = flight_results["alternatives"][0] if flight_results["count"] > 0 else None
+        best_hotel = hotel_results["hotels"][0] if hotel_results and hotel_results["count"] > 0 else None
+        
         # Step 3: Calculate total cost including flight
-        if flight_results["count"] > 0:
-            best_flight = flight_results["alternatives"][0]
+        if best_flight is not None:
             # Estimate total flight cost (price shown is per person in some APIs)
             flight_cost = best_flight["price"]["total"] * passenger_count
             total_cost += flight_cost
@@ -443,24 +577,24 @@ async def comprehensive_reaccommodation_tool(
             "actions": []
         }
         
-        if flight_results["count"] > 0:
+        if vip_count > 0:
             recommended_plan["actions"].append({
-                "type": "rebook_flight",
-                "details": f"Rebook on {flight_results['alternatives'][0]['flight_number']}",
-                "departure_time": flight_results['alternatives'][0]['departure']['time']
+                "type": "vip_priority",
+                "details": f"Prioritize {vip_count} VIP passengers for immediate rebooking"
             })
         
-        if needs_hotel and hotel_results and hotel_results["count"] > 0:
+        if best_flight is not None:
             recommended_plan["actions"].append({
-                "type": "book_hotel",
-                "details": f"Arrange overnight stay at {hotel_results['hotels'][0]['name']}",
-                "cost": hotel_results['hotels'][0]['price']['total']
+                "type": "rebook_flight",
+                "details": f"Rebook on {best_flight['flight_number']}",
+                "departure_time": best_flight['departure']['time']
             })
         
-        if vip_count > 0:
-            recommended_plan["actions"].insert(0, {
-                "type": "vip_priority",
-                "details": f"Prioritize {vip_count} VIP passengers for immediate rebooking"
+        if best_hotel is not None:
+            recommended_plan["actions"].append({
+                "type": "book_hotel",
+                "details": f"Arrange overnight stay at {best_hotel['name']}",
+                "cost": best_hotel['price']['total']
             })
         
         recommended_plan["actions"].append({
@@ -468,12 +602,13 @@ async def comprehensive_reaccommodation_tool(
             "details": "Send SMS/email notifications with new itinerary"
         })
         
-        logger.info(
-            f"✅ Re-accommodation plan complete. "
-            f"Flights: {flight_results['count']}, "
-            f"Hotels: {hotel_results['count'] if hotel_results else 0}, "
-            f"Est. cost: ${total_cost:.2f}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✅ Re-accommodation plan complete. Flights: %s, Hotels: %s, Est. cost: $%.2f",
+                flight_results["count"],
+                hotel_results["count"] if hotel_results else 0,
+                total_cost,
+            )
         
         return {
             "flight_options": flight_results,
@@ -490,7 +625,7 @@ async def comprehensive_reaccommodation_tool(
         }
         
     except Exception as e:
-        logger.error(f"Error in comprehensive re-accommodation: {e}", exc_info=True)
+        logger.error("Error in comprehensive re-accommodation: %s", e, exc_info=True)
         return {
             "flight_options": {"alternatives": [], "count": 0},
             "hotel_options": None,
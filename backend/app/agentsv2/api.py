@@ -7,9 +7,15 @@ allowing integration with the existing FastAPI backend.
 import logging
 from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 from pydantic import BaseModel, Field
 
+from .serialization import (
+    MSGPACK_MEDIA_TYPE,
+    json_dumps,
+    msgpack_available,
+    msgpack_dumps,
+)
 from .workflow import DisruptionWorkflowADK
 
 
@@ -58,53 +64,72 @@ class DisruptionResponse(BaseModel):
 
 
 @router.post("/analyze", response_model=DisruptionResponse)
-async def analyze_disruption(flight_data: FlightData) -> DisruptionResponse:
+async def analyze_disruption(
+    flight_data: FlightData,
+    accept: str | None = Header(default=None),
+) -> Response:
     """Analyze flight data for potential disruptions using ADK workflow.
     
     This endpoint accepts flight monitor data and runs the multi-agent
-    disruption analysis workflow.
+    disruption analysis workflow. Clients sending
+    ``Accept: application/msgpack`` get the same body as MessagePack, which
+    is smaller and cheaper to decode for services that store or forward it.
+    
+    The body is built from data the workflow produced itself, so it is
+    encoded directly rather than validated against ``DisruptionResponse``
+    (which still documents the schema).
     
     Args:
         flight_data: Flight statistics, records, and alerts
+        accept: Accept header used to negotiate the response encoding
         
     Returns:
-        DisruptionResponse with analysis results
+        Encoded DisruptionResponse body with analysis results
         
     Raises:
         HTTPException: If workflow execution fails
     """
     try:
-        logger.info(f"🔍 Analyzing disruption for {flight_data.airport}/{flight_data.carrier}")
+        logger.info("🔍 Analyzing disruption for %s/%s", flight_data.airport, flight_data.carrier)
         
         # Get workflow instance
         workflow = get_workflow()
         
-        # Execute workflow
-        result = await workflow.run(flight_data.dict())
+        # Execute workflow. dict(model) hands over the parsed field values
+        # as they are; model_dump()/dict() would deep-copy every flight
+        # record and alert the request just decoded.
+        result = await workflow.run(dict(flight_data))
         
-        # Format response
-        response = DisruptionResponse(
-            success=True,
-            disruption_detected=result.get("disruption_detected", False),
-            final_plan=result.get("final_plan", {}),
-            risk_assessment=result.get("risk_assessment", {}),
-            rebooking_plan=result.get("rebooking_plan", {}),
-            finance_estimate=result.get("finance_estimate", {}),
-            crew_rotation=result.get("crew_rotation", {}),
-            simulation_results=result.get("simulation_results", []),
-            audit_log=result.get("audit_log", []),
-            decision_log=result.get("decision_log", []),
-        )
+        # Format response (fields of DisruptionResponse)
+        body = {
+            "success": True,
+            "disruption_detected": result.get("disruption_detected", False),
+            "final_plan": result.get("final_plan", {}),
+            "risk_assessment": result.get("risk_assessment", {}),
+            "rebooking_plan": result.get("rebooking_plan", {}),
+            "finance_estimate": result.get("finance_estimate", {}),
+            "crew_rotation": result.get("crew_rotation", {}),
+            "simulation_results": result.get("simulation_results", []),
+            "audit_log": result.get("audit_log", []),
+            "decision_log": result.get("decision_log", []),
+            "error": None,
+        }
         
         logger.info(
-            f"✅ Analysis complete: Disruption={response.disruption_detected}, "
-            f"Priority={response.final_plan.get('priority', 'N/A')}"
+            "✅ Analysis complete: Disruption=%s, Priority=%s",
+            body["disruption_detected"],
+            body["final_plan"].get("priority", "N/A"),
         )
         
-        return response
+        if accept and MSGPACK_MEDIA_TYPE in accept and msgpack_available():
+            return Response(
+                content=msgpack_dumps(body),
+                media_type=MSGPACK_MEDIA_TYPE,
+            )
+        return Response(content=json_dumps(body), media_type="application/json")
         
     except Exception as e:
-        logger.error(f"❌ Workflow execution failed: {e}", exc_info=True)
+        logger.error("❌ Workflow execution failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Disruption analysis failed: {str(e)}"
@@ -126,7 +151,7 @@ async def health_check() -> Dict[str, str]:
             "workflow": workflow.__class__.__name__
         }
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return {
             "status": "unhealthy",
             "error": str(e)
@@ -0,0 +1,97 @@
+"""Micro-batching dispatcher for chat-model calls.
+
+Concurrent workflow runs often ask the provider the same question within a few
+milliseconds of each other (same airport, carrier and stats). The batcher
+collects calls arriving within a short window, sends each distinct prompt once
+and fans the reply out to every waiter. Distinct prompts in the window are
+dispatched concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .serialization import json_dumps
+
+
+_Request = Tuple[Any, Sequence[Any], Dict[str, Any], "asyncio.Future[Any]"]
+
+
+class LLMBatcher:
+    """Collect ``ainvoke`` calls for up to ``max_latency_ms`` and dispatch them together.
+
+    A latency of zero (or a batch size below two) disables batching; callers
+    check ``enabled`` and invoke the model directly in that case.
+    """
+
+    def __init__(self, max_batch: int, max_latency_ms: float):
+        self.max_batch = max_batch
+        self.max_latency = max_latency_ms / 1000
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_Request] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        # The loop only holds tasks weakly; keep in-flight dispatches alive.
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_latency > 0 and self.max_batch > 1
+
+    async def submit(self, llm: Any, messages: Sequence[Any], **kwargs: Any) -> Any:
+        """Queue one ``llm.ainvoke(messages, **kwargs)`` call and await its reply."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queues are bound to a loop; run_sync() starts a fresh one per call.
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+        future: asyncio.Future[Any] = loop.create_future()
+        self._queue.put_nowait((llm, messages, kwargs, future))  # type: ignore[union-attr]
+        return await future
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        assert queue is not None
+        while True:
+            batch: List[_Request] = [await queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = loop.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _dispatch(batch: List[_Request]) -> None:
+        groups: Dict[Tuple[int, str], List[_Request]] = {}
+        for request in batch:
+            llm, messages, kwargs, _ = request
+            key = (id(llm), json_dumps([[(m.type, m.content) for m in messages], kwargs]))
+            groups.setdefault(key, []).append(request)
+
+        replies = await asyncio.gather(
+            *(
+                llm.ainvoke(messages, **kwargs)
+                for llm, messages, kwargs, _ in (group[0] for group in groups.values())
+            ),
+            return_exceptions=True,
+        )
+        for group, reply in zip(groups.values(), replies):
+            for *_, future in group:
+                if future.done():  # caller was cancelled
+                    continue
+                if isinstance(reply, BaseException):
+                    future.set_exception(reply)
+                else:
+                    future.set_result(reply)
+
+
+__all__ = ["LLMBatcher"]
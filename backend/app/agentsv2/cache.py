@@ -0,0 +1,136 @@
+"""Small in-process caches shared by the ADK agents and tools."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire ``ttl`` seconds after insert.
+
+    A ``ttl`` of zero (or less) disables the cache: ``get`` always misses and
+    ``set`` is a no-op, so callers never need to branch on configuration.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if self._timer() >= expires_at:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def async_ttl_cache(
+    maxsize: int,
+    ttl: float,
+    key: Callable[..., Hashable],
+    cache_if: Callable[[Any], bool] | None = None,
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Memoize a coroutine function in a ``TTLCache``.
+
+    Concurrent misses for the same key share one call (single flight), so a
+    burst of identical requests awaits the wrapped function once. Failures
+    are not cached, nor are results ``cache_if`` rejects. Cached values are
+    shared between callers, who must copy them before mutating.
+
+    Args:
+        maxsize: Maximum number of cached results
+        ttl: Seconds a result stays valid; zero disables caching
+        key: Builds the cache key from the wrapped function's arguments
+        cache_if: Optional predicate; results it returns False for are
+            handed to the waiting callers but not stored
+    """
+
+    def decorator(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        inflight: Dict[Hashable, asyncio.Future[_T]] = {}
+        stats = {"hits": 0, "misses": 0}
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            if not cache.enabled:
+                return await func(*args, **kwargs)
+            cache_key = key(*args, **kwargs)
+            value = cache.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                stats["hits"] += 1
+                logger.debug("%s cache hit (%d hits / %d misses)", func.__name__, stats["hits"], stats["misses"])
+                return value
+            pending = inflight.get(cache_key)
+            if pending is not None:
+                stats["hits"] += 1
+                return await asyncio.shield(pending)
+
+            stats["misses"] += 1
+            logger.debug("%s cache miss (%d hits / %d misses)", func.__name__, stats["hits"], stats["misses"])
+            future: asyncio.Future[_T] = asyncio.get_running_loop().create_future()
+            inflight[cache_key] = future
+            try:
+                value = await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except BaseException as exc:
+                future.set_exception(exc)
+                # Mark retrieved so a failure nobody else awaited is not logged.
+                future.exception()
+                raise
+            else:
+                if cache_if is None or cache_if(value):
+                    cache.set(cache_key, value)
+                future.set_result(value)
+                return value
+            finally:
+                del inflight[cache_key]
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+__all__ = ["TTLCache", "async_ttl_cache"]
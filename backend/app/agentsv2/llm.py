@@ -7,89 +7,264 @@ without pulling in the archived modules under `#__agents`.
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import importlib.util
+import logging
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
+import httpx
 from langchain_core.language_models import BaseChatModel
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage
 
 from ..config import settings
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from langchain_openai import ChatOpenAI
+
+
+logger = logging.getLogger(__name__)
+
+# Connection pool shared by every request a cached client makes; keeping the
+# sockets alive avoids a TLS handshake per agent call.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+# With h2 installed (``httpx[http2]``) the parallel sub-agent calls multiplex
+# over one connection instead of opening one each.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_WARMUP_TIMEOUT = 10.0
+# Each model holds an httpx.AsyncClient whose pool is bound to the loop that
+# first used it, so async callers get their own models per event loop.
+_LOOP_LLMS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, BaseChatModel]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Provider -> (Settings attribute holding its API key, and its base URL)
+_PROVIDER_SETTINGS: dict[str, tuple[str, str | None]] = {
+    "openai": ("openai_api_key", "openai_base_url"),
+    "openrouter": ("openrouter_api_key", "openrouter_base_url"),
+    "deepseek": ("deepseek_api_key", "deepseek_base_url"),
+    "gemini": ("gemini_api_key", None),
+}
+
 
 class LLMProviderError(RuntimeError):
     """Raised when the configured provider cannot be instantiated."""
 
 
 def get_llm(provider_override: str | None = None) -> BaseChatModel:
-    """Return a LangChain-compatible chat model for the configured provider."""
+    """Return a LangChain-compatible chat model for the configured provider.
+
+    Instances are memoized on the resolved configuration and the running
+    event loop, so every agent and every workflow run on a loop shares the
+    same client and its connection pool.
+    """
     provider = (provider_override or settings.llm_provider).lower()
 
-    if provider == "openai":
-        return _build_openai_llm()
-    if provider == "openrouter":
-        return _build_openrouter_llm()
-    if provider == "deepseek":
-        return _build_deepseek_llm()
-    if provider == "gemini":
-        return _build_gemini_llm()
-
-    raise LLMProviderError(
-        f"Unsupported LLM provider '{provider}'. "
-        "Supported providers: openai, openrouter, deepseek, gemini."
+    setting_names = _PROVIDER_SETTINGS.get(provider)
+    if setting_names is None:
+        raise LLMProviderError(
+            f"Unsupported LLM provider '{provider}'. "
+            f"Supported providers: {', '.join(_PROVIDER_SETTINGS)}."
+        )
+    api_key_name, base_url_name = setting_names
+
+    config = (
+        provider,
+        settings.llm_model,
+        settings.llm_temperature,
+        getattr(settings, api_key_name),
+        getattr(settings, base_url_name) if base_url_name else None,
     )
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _build_llm(*config)
+
+    models = _LOOP_LLMS.setdefault(loop, {})
+    model = models.get(config)
+    if model is None:
+        model = models[config] = _BUILDERS[provider](*config[1:])
+    return model
+
+
+async def warmup_llm(ping: bool = True) -> bool:
+    """Build the configured client and optionally send a 1-token probe.
+
+    Called at application startup so the first analysis request finds the
+    client constructed and its connection pool already holding a live TLS
+    session. Failures are logged rather than raised so a misconfigured
+    provider never blocks startup.
+
+    Returns:
+        True when the client is ready (and the probe, if sent, succeeded).
+    """
+    try:
+        llm = get_llm()
+    except LLMProviderError as exc:
+        logger.warning("LLM warmup skipped: %s", exc)
+        return False
+
+    if not ping:
+        return True
+
+    try:
+        await asyncio.wait_for(
+            llm.ainvoke([HumanMessage(content="ping")], max_tokens=1),
+            timeout=_WARMUP_TIMEOUT,
+        )
+    except Exception as exc:  # pragma: no cover - network failures
+        logger.warning("LLM warmup probe failed: %s", exc)
+        return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def transient_llm_errors() -> tuple[type[BaseException], ...]:
+    """Exception types that mean an LLM call failed and the caller should fall back.
 
+    Covers provider timeouts, connection and rate-limit errors, and malformed
+    responses. Callers still fall back on other errors but log them with a
+    traceback, since those usually point at a bug or a misconfigured client.
+    Provider SDK errors are resolved on first use so this module does not
+    import them.
+    """
+    errors: list[type[BaseException]] = [httpx.HTTPError, asyncio.TimeoutError, ValueError]
+    try:
+        import openai
+
+        errors.append(openai.APIError)
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+    try:
+        from google.api_core import exceptions as google_exceptions
+
+        errors.append(google_exceptions.GoogleAPIError)
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+    try:
+        # Raised by the Gemini chat model and not a GoogleAPIError subclass.
+        from langchain_google_genai.chat_models import ChatGoogleGenerativeAIError
+
+        errors.append(ChatGoogleGenerativeAIError)
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+    return tuple(errors)
 
-def _build_openai_llm() -> ChatOpenAI:
-    if not settings.openai_api_key:
+
+@lru_cache(maxsize=8)
+def _build_llm(
+    provider: str,
+    model: str,
+    temperature: float,
+    api_key: str | None,
+    base_url: str | None,
+) -> BaseChatModel:
+    return _BUILDERS[provider](model, temperature, api_key, base_url)
+
+
+@lru_cache(maxsize=1)
+def _chat_openai_class() -> type[ChatOpenAI]:
+    # Imported on first use so Gemini-only deployments never load the OpenAI SDK.
+    try:
+        from langchain_openai import ChatOpenAI
+    except ImportError as exc:  # pragma: no cover - import guard
+        raise LLMProviderError(
+            "langchain-openai is required for the OpenAI-compatible providers. "
+            "Install via `uv pip install langchain-openai`."
+        ) from exc
+    return ChatOpenAI
+
+
+def _request_limits() -> dict[str, Any]:
+    # A hung provider call should fail fast into the agent's heuristic
+    # fallback rather than wait out the SDK defaults (60s, two retries).
+    return {
+        "timeout": settings.llm_request_timeout,
+        "max_retries": settings.llm_max_retries,
+    }
+
+
+def _pooled_http_clients() -> dict[str, Any]:
+    return {
+        "http_client": httpx.Client(
+            limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=_HTTP2
+        ),
+        "http_async_client": httpx.AsyncClient(
+            limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=_HTTP2
+        ),
+    }
+
+
+def _build_openai_llm(
+    model: str, temperature: float, api_key: str | None, base_url: str | None
+) -> ChatOpenAI:
+    if not api_key:
         raise LLMProviderError(
             "OPENAI_API_KEY must be set when LLM_PROVIDER=openai."
         )
 
     kwargs: dict[str, Any] = {
-        "model": settings.llm_model,
-        "temperature": settings.llm_temperature,
-        "api_key": settings.openai_api_key,
+        "model": model,
+        "temperature": temperature,
+        "api_key": api_key,
+        **_request_limits(),
+        **_pooled_http_clients(),
     }
 
-    if settings.openai_base_url:
-        kwargs["base_url"] = settings.openai_base_url
+    if base_url:
+        kwargs["base_url"] = base_url
 
-    return ChatOpenAI(**kwargs)
+    return _chat_openai_class()(**kwargs)
 
 
-def _build_openrouter_llm() -> ChatOpenAI:
-    if not settings.openrouter_api_key:
+def _build_openrouter_llm(
+    model: str, temperature: float, api_key: str | None, base_url: str | None
+) -> ChatOpenAI:
+    if not api_key:
         raise LLMProviderError(
             "OPENROUTER_API_KEY must be set when LLM_PROVIDER=openrouter."
         )
 
-    return ChatOpenAI(
-        model=settings.llm_model,
-        temperature=settings.llm_temperature,
-        api_key=settings.openrouter_api_key,
-        base_url=settings.openrouter_base_url,
+    return _chat_openai_class()(
+        model=model,
+        temperature=temperature,
+        api_key=api_key,
+        base_url=base_url,
         default_headers={
             "HTTP-Referer": "https://github.com/runwayops",
             "X-Title": "Runway Ops Flight Monitor",
         },
+        **_request_limits(),
+        **_pooled_http_clients(),
     )
 
 
-def _build_deepseek_llm() -> ChatOpenAI:
-    if not settings.deepseek_api_key:
+def _build_deepseek_llm(
+    model: str, temperature: float, api_key: str | None, base_url: str | None
+) -> ChatOpenAI:
+    if not api_key:
         raise LLMProviderError(
             "DEEPSEEK_API_KEY must be set when LLM_PROVIDER=deepseek."
         )
 
-    return ChatOpenAI(
-        model=settings.llm_model,
-        temperature=settings.llm_temperature,
-        api_key=settings.deepseek_api_key,
-        base_url=settings.deepseek_base_url,
+    return _chat_openai_class()(
+        model=model,
+        temperature=temperature,
+        api_key=api_key,
+        base_url=base_url,
+        **_request_limits(),
+        **_pooled_http_clients(),
     )
 
 
-def _build_gemini_llm() -> BaseChatModel:
-    if not settings.gemini_api_key:
+def _build_gemini_llm(
+    model: str, temperature: float, api_key: str | None, base_url: str | None
+) -> BaseChatModel:
+    # Gemini has no configurable endpoint; base_url is always None.
+    if not api_key:
         raise LLMProviderError(
             "GEMINI_API_KEY must be set when LLM_PROVIDER=gemini."
         )
@@ -103,10 +278,19 @@ def _build_gemini_llm() -> BaseChatModel:
         ) from exc
 
     return ChatGoogleGenerativeAI(
-        model=settings.llm_model,
-        temperature=settings.llm_temperature,
-        google_api_key=settings.gemini_api_key,
+        model=model,
+        temperature=temperature,
+        google_api_key=api_key,
+        **_request_limits(),
     )
 
 
-__all__ = ["get_llm", "LLMProviderError"]
+_BUILDERS = {
+    "openai": _build_openai_llm,
+    "openrouter": _build_openrouter_llm,
+    "deepseek": _build_deepseek_llm,
+    "gemini": _build_gemini_llm,
+}
+
+
+__all__ = ["get_llm", "warmup_llm", "transient_llm_errors", "LLMProviderError"]
@@ -0,0 +1,76 @@
+"""JSON encoding helpers for prompts, LLM replies and the audit trail.
+
+Uses ``orjson`` when it is installed and falls back to the standard library,
+so the speedup stays optional. ``msgpack`` is likewise optional and only
+used for clients that ask for a binary response.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def json_dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string.
+
+    Values JSON cannot represent natively (datetimes, ObjectIds, ...) are
+    rendered with ``str()``. ``sort_keys`` gives equal mappings the same text
+    regardless of insertion order, which prompt caches key on.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, default=str, indent=2 if indent else None, sort_keys=sort_keys)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text. Raises ``json.JSONDecodeError`` on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def msgpack_available() -> bool:
+    """Whether MessagePack encoding is available in this environment."""
+    return msgpack is not None
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to MessagePack, rendering unsupported values with ``str()``.
+
+    Callers check ``msgpack_available()`` first.
+    """
+    return msgpack.packb(obj, default=str, use_bin_type=True)
+
+
+def payload_digest(text: str) -> str:
+    """Short stable fingerprint of a serialized payload."""
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+__all__ = [
+    "MSGPACK_MEDIA_TYPE",
+    "json_dumps",
+    "json_loads",
+    "msgpack_available",
+    "msgpack_dumps",
+    "payload_digest",
+]
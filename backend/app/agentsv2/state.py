@@ -4,91 +4,190 @@ ADK uses message-passing and shared context, similar to LangGraph's AgentState.
 This module defines the state structure and logging utilities.
 """
 
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
+from ..config import settings
+from .serialization import json_dumps, json_loads
 
-class DisruptionState(BaseModel):
+
+class AuditLog:
+    """Append-only, bounded log of agent reasoning traces.
+    
+    Each entry is serialized to compact JSON when it is appended, so the log
+    keeps a detached snapshot rather than live references to the (often
+    large) agent inputs and outputs, and entries are decoded only when read.
+    The newest ``maxlen`` entries are retained.
+    """
+    
+    def __init__(
+        self,
+        entries: Iterable[Dict[str, Any]] = (),
+        maxlen: int | None = None,
+    ):
+        self._records: deque[str] = deque(
+            maxlen=maxlen or settings.audit_log_max_entries
+        )
+        self._next_id = 0
+        for entry in entries:
+            self.append(entry)
+    
+    def append(self, entry: Dict[str, Any]) -> int:
+        """Store a snapshot of ``entry`` and return its sequence id."""
+        self._records.append(json_dumps(entry))
+        entry_id = self._next_id
+        self._next_id += 1
+        return entry_id
+    
+    @property
+    def dropped(self) -> int:
+        """Number of entries evicted because the log reached ``maxlen``."""
+        return self._next_id - len(self._records)
+    
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Decode every retained entry, oldest first."""
+        return [json_loads(record) for record in self._records]
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return json_loads(self._records[index])
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (json_loads(record) for record in self._records)
+    
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+@dataclass(slots=True)
+class FlightColumns:
+    """Flights sharing one ``statusCategory``, stored as parallel columns.
+    
+    Row ``i`` of every column describes ``records[i]``; missing fields are
+    None. Agents read the columns they need instead of probing each flight
+    dict with ``get``.
+    """
+    
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    ids: List[Any] = field(default_factory=list)
+    routes: List[Any] = field(default_factory=list)
+    destinations: List[Any] = field(default_factory=list)
+    departures: List[Any] = field(default_factory=list)
+    
+    def append(self, flight: Dict[str, Any]) -> None:
+        self.records.append(flight)
+        self.ids.append(flight.get("id"))
+        self.routes.append(flight.get("route"))
+        self.destinations.append(flight.get("destination"))
+        self.departures.append(flight.get("scheduledDeparture"))
+    
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+@dataclass(slots=True)
+class DisruptionState:
     """Shared state for the ADK-based disruption workflow.
     
-    This state is passed between agents and accumulates results.
-    Uses Pydantic for validation and serialization.
+    This state is passed between agents and accumulates results. A slotted
+    dataclass rather than a validated model: agents read and write its
+    fields many times per run, and its inputs are already validated at the
+    API boundary.
     """
     
-    # Input data from provider
-    input_data: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Flight details and signals from monitor"
-    )
+    # Input data from provider: flight details and signals from monitor
+    input_data: Dict[str, Any] = field(default_factory=dict)
     
     # Detection & assessment
-    disruption_detected: bool = Field(
-        default=False,
-        description="Whether a disruption was detected"
-    )
-    risk_assessment: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Risk assessment from predictive analysis"
-    )
-    signal_breakdown: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Breakdown of risk signals (weather, aircraft, crew)"
-    )
+    disruption_detected: bool = False
+    # Risk assessment from predictive analysis
+    risk_assessment: Dict[str, Any] = field(default_factory=dict)
+    # Breakdown of risk signals (weather, aircraft, crew)
+    signal_breakdown: Dict[str, Any] = field(default_factory=dict)
     
     # Agent outputs
-    rebooking_plan: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Passenger re-accommodation plan"
-    )
-    finance_estimate: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Financial impact estimate"
-    )
-    crew_rotation: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Crew scheduling adjustments"
-    )
+    rebooking_plan: Dict[str, Any] = field(default_factory=dict)
+    finance_estimate: Dict[str, Any] = field(default_factory=dict)
+    crew_rotation: Dict[str, Any] = field(default_factory=dict)
     
-    # What-if simulations
-    simulation_results: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="Results from what-if scenario simulations"
-    )
-    what_if_templates: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="Raw scenario templates before enrichment"
-    )
+    # What-if simulations and the raw templates before enrichment
+    simulation_results: List[Dict[str, Any]] = field(default_factory=list)
+    what_if_templates: List[Dict[str, Any]] = field(default_factory=list)
     
-    # Transparency & audit
-    audit_log: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="Immutable append-only log of all agent reasoning"
-    )
-    decision_log: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="Chronological decision trail from every agent"
-    )
+    # Transparency & audit: append-only agent reasoning and decision trail.
+    # Plain lists of entries are accepted and wrapped in an AuditLog.
+    audit_log: AuditLog = field(default_factory=AuditLog)
+    decision_log: List[Dict[str, Any]] = field(default_factory=list)
     
     # Final aggregated output
-    final_plan: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Final aggregated action plan"
-    )
+    final_plan: Dict[str, Any] = field(default_factory=dict)
     
     # Progress tracking for real-time updates
-    progress_updates: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="Real-time progress updates for UI feedback"
-    )
+    progress_updates: List[Dict[str, Any]] = field(default_factory=list)
     
     # Progress callback (not serialized)
-    _progress_callback: Optional[Callable[[str, str, str], None]] = None
+    _progress_callback: Optional[Callable[[str, str, str], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Per-run flight summary shared by every agent (see get_flight_summary)
+    _flight_summary: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        if not isinstance(self.audit_log, AuditLog):
+            self.audit_log = AuditLog(self.audit_log or ())
+
+
+def get_flight_summary(state: DisruptionState) -> Dict[str, Any]:
+    """Return the per-run flight summary, computing it on first use.
+    
+    The flight list is scanned and the stats serialized once per run, so the
+    agents that need critical flights or the stats JSON share one copy.
+    
+    A single pass over the flight list groups flights by status into
+    ``FlightColumns``, in input order.
     
-    class Config:
-        """Pydantic configuration."""
-        arbitrary_types_allowed = True
-        underscore_attrs_are_private = True
+    Args:
+        state: Current disruption state
+        
+    Returns:
+        Dictionary with flights_by_status (status -> FlightColumns),
+        critical_count, first_critical (the first critical flight or None),
+        flight_count, stats_json and flight_json (airport, carrier and stats)
+    """
+    summary = state._flight_summary
+    if summary is None:
+        input_data = state.input_data
+        flights = input_data.get("flights") or ()
+        stats = input_data.get("stats", {})
+        flights_by_status: Dict[Any, FlightColumns] = {}
+        for flight in flights:
+            status = flight.get("statusCategory")
+            columns = flights_by_status.get(status)
+            if columns is None:
+                columns = flights_by_status[status] = FlightColumns()
+            columns.append(flight)
+        critical = flights_by_status.get("critical")
+        summary = {
+            "flights_by_status": flights_by_status,
+            "critical_count": len(critical) if critical else 0,
+            "first_critical": critical.records[0] if critical else None,
+            "flight_count": len(flights),
+            "stats_json": json_dumps(stats, sort_keys=True),
+            "flight_json": json_dumps(
+                {
+                    "airport": input_data.get("airport"),
+                    "carrier": input_data.get("carrier"),
+                    "stats": input_data.get("stats"),
+                },
+                sort_keys=True,
+            ),
+        }
+        state._flight_summary = summary
+    return summary
 
 
 def log_reasoning(
@@ -4,11 +4,12 @@ This script tests the complete workflow with mock flight data.
 """
 
 import asyncio
-import json
 import logging
 import sys
 from pathlib import Path
 
+from .serialization import json_dumps
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,6 +18,8 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 80
+
 
 # Mock flight data for testing
 MOCK_FLIGHT_DATA = {
@@ -71,9 +74,9 @@ MOCK_FLIGHT_DATA = {
 
 async def test_workflow():
     """Test the ADK workflow with mock data."""
-    logger.info("=" * 80)
+    logger.info(_BANNER)
     logger.info("🧪 Starting ADK Workflow Integration Test")
-    logger.info("=" * 80)
+    logger.info(_BANNER)
     
     try:
         # Import workflow
@@ -84,66 +87,18 @@ async def test_workflow():
         logger.info("✅ Workflow initialized")
         
         # Execute workflow
-        logger.info("\n📊 Test Data:")
-        logger.info(json.dumps(MOCK_FLIGHT_DATA, indent=2))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n📊 Test Data:\n%s", json_dumps(MOCK_FLIGHT_DATA, indent=True))
         
         result = await workflow.run(MOCK_FLIGHT_DATA)
         
         # Display results
-        logger.info("\n" + "=" * 80)
-        logger.info("📋 WORKFLOW RESULTS")
-        logger.info("=" * 80)
-        
-        logger.info(f"\n🎯 Disruption Detected: {result['disruption_detected']}")
-        
-        if result['disruption_detected']:
-            final_plan = result['final_plan']
-            logger.info(f"⚠️  Priority: {final_plan.get('priority', 'N/A')}")
-            logger.info(f"🎬 Action: {final_plan.get('recommended_action', 'N/A')}")
-            
-            # Risk Assessment
-            risk = result.get('risk_assessment', {})
-            logger.info(f"\n📊 Risk Assessment:")
-            logger.info(f"  - Likelihood: {risk.get('likelihood', 0):.2%}")
-            logger.info(f"  - Duration: {risk.get('duration_minutes', 0)} minutes")
-            logger.info(f"  - Impact: {risk.get('pax_impact', 'N/A')}")
-            
-            # Rebooking
-            rebooking = result.get('rebooking_plan', {})
-            logger.info(f"\n✈️  Rebooking Plan:")
-            logger.info(f"  - Strategy: {rebooking.get('strategy', 'N/A')}")
-            logger.info(f"  - Hotel Required: {rebooking.get('hotel_required', False)}")
-            logger.info(f"  - Affected Passengers: {rebooking.get('estimated_pax', 0)}")
-            
-            # Finance
-            finance = result.get('finance_estimate', {})
-            logger.info(f"\n💰 Financial Impact:")
-            logger.info(f"  - Total Cost: ${finance.get('total_usd', 0):,}")
-            logger.info(f"  - Compensation: ${finance.get('compensation_usd', 0):,}")
-            logger.info(f"  - Hotel/Meals: ${finance.get('hotel_meals_usd', 0):,}")
-            
-            # Crew
-            crew = result.get('crew_rotation', {})
-            logger.info(f"\n👥 Crew Management:")
-            logger.info(f"  - Changes Needed: {crew.get('crew_changes_needed', False)}")
-            logger.info(f"  - Backup Crew: {crew.get('backup_crew_required', 0)}")
-            
-            # What-if scenarios
-            scenarios = result.get('simulation_results', [])
-            if scenarios:
-                logger.info(f"\n🔮 What-If Scenarios: {len(scenarios)}")
-                for i, scenario in enumerate(scenarios, 1):
-                    logger.info(f"  {i}. {scenario.get('scenario', 'N/A')}")
+        if logger.isEnabledFor(logging.INFO):
+            _log_results(result)
         
-        # Audit Log Summary
-        audit_log = result.get('audit_log', [])
-        logger.info(f"\n📝 Audit Log: {len(audit_log)} entries")
-        for entry in audit_log:
-            logger.info(f"  - {entry.get('agent')}: {entry.get('timestamp')}")
-        
-        logger.info("\n" + "=" * 80)
+        logger.info("\n%s", _BANNER)
         logger.info("✅ Integration Test Complete")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         
         return result
         
@@ -152,6 +107,60 @@ async def test_workflow():
         return None
 
 
+def _log_results(result: dict) -> None:
+    """Log a readable summary of the workflow result."""
+    logger.info("\n%s", _BANNER)
+    logger.info("📋 WORKFLOW RESULTS")
+    logger.info(_BANNER)
+    
+    logger.info(f"\n🎯 Disruption Detected: {result['disruption_detected']}")
+    
+    if result['disruption_detected']:
+        final_plan = result['final_plan']
+        logger.info(f"⚠️  Priority: {final_plan.get('priority', 'N/A')}")
+        logger.info(f"🎬 Action: {final_plan.get('recommended_action', 'N/A')}")
+        
+        # Risk Assessment
+        risk = result.get('risk_assessment', {})
+        logger.info(f"\n📊 Risk Assessment:")
+        logger.info(f"  - Likelihood: {risk.get('likelihood', 0):.2%}")
+        logger.info(f"  - Duration: {risk.get('duration_minutes', 0)} minutes")
+        logger.info(f"  - Impact: {risk.get('pax_impact', 'N/A')}")
+        
+        # Rebooking
+        rebooking = result.get('rebooking_plan', {})
+        logger.info(f"\n✈️  Rebooking Plan:")
+        logger.info(f"  - Strategy: {rebooking.get('strategy', 'N/A')}")
+        logger.info(f"  - Hotel Required: {rebooking.get('hotel_required', False)}")
+        logger.info(f"  - Affected Passengers: {rebooking.get('estimated_pax', 0)}")
+        
+        # Finance
+        finance = result.get('finance_estimate', {})
+        logger.info(f"\n💰 Financial Impact:")
+        logger.info(f"  - Total Cost: ${finance.get('total_usd', 0):,}")
+        logger.info(f"  - Compensation: ${finance.get('compensation_usd', 0):,}")
+        logger.info(f"  - Hotel/Meals: ${finance.get('hotel_meals_usd', 0):,}")
+        
+        # Crew
+        crew = result.get('crew_rotation', {})
+        logger.info(f"\n👥 Crew Management:")
+        logger.info(f"  - Changes Needed: {crew.get('crew_changes_needed', False)}")
+        logger.info(f"  - Backup Crew: {crew.get('backup_crew_required', 0)}")
+        
+        # What-if scenarios
+        scenarios = result.get('simulation_results', [])
+        if scenarios:
+            logger.info(f"\n🔮 What-If Scenarios: {len(scenarios)}")
+            for i, scenario in enumerate(scenarios, 1):
+                logger.info(f"  {i}. {scenario.get('scenario', 'N/A')}")
+    
+    # Audit Log Summary
+    audit_log = result.get('audit_log', [])
+    logger.info(f"\n📝 Audit Log: {len(audit_log)} entries")
+    for entry in audit_log:
+        logger.info(f"  - {entry.get('agent')}: {entry.get('timestamp')}")
+
+
 def main():
     """Main entry point."""
     # Run async test
@@ -160,8 +169,7 @@ def main():
     if result:
         # Save result to file
         output_file = Path(__file__).parent / "test_result.json"
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        output_file.write_text(json_dumps(result, indent=True))
         logger.info(f"\n💾 Results saved to: {output_file}")
         return 0
     else:
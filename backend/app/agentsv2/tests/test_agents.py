@@ -1,6 +1,8 @@
+import weakref
+
 import pytest
 
-from app.agentsv2 import agents
+from app.agentsv2 import agents, llm
 from app.agentsv2.agents import (
     PredictiveAgent,
     OrchestratorAgent,
@@ -34,6 +36,7 @@ async def test_predictive_agent_updates_state_and_audit_log(monkeypatch: pytest.
                 "aircraftScore": 0.6,
                 "crewScore": 0.5,
             },
+            "flights": [{"id": "CX1"}, {"id": "CX2"}],
         }
     )
 
@@ -43,6 +46,10 @@ async def test_predictive_agent_updates_state_and_audit_log(monkeypatch: pytest.
     assert new_state.disruption_detected is True
     assert new_state.risk_assessment["risk_probability"] == 0.9
     assert new_state.audit_log and new_state.audit_log[-1]["agent"] == "PredictiveAgent"
+    audited_input = new_state.audit_log[-1]["input"]
+    assert audited_input["flight_count"] == 2
+    assert audited_input["alert_count"] == 0
+    assert "flights" not in audited_input
 
 
 @pytest.mark.asyncio
@@ -159,6 +166,7 @@ async def test_rebooking_agent_applies_tool_plan(monkeypatch: pytest.MonkeyPatch
                 }
             ],
         },
+        disruption_detected=True,
         risk_assessment={"duration_minutes": 120},
     )
 
@@ -172,6 +180,28 @@ async def test_rebooking_agent_applies_tool_plan(monkeypatch: pytest.MonkeyPatch
     assert new_state.audit_log and new_state.audit_log[-1]["agent"] == "RebookingAgent"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("carrier", "expected"), [("CX", 12), ("KA", 8), ("UO", 10)])
+async def test_rebooking_agent_sizes_vips_by_carrier(
+    monkeypatch: pytest.MonkeyPatch, carrier: str, expected: int
+) -> None:
+    seen = {}
+
+    async def fake_rebooking_tool(**kwargs: object) -> dict:
+        seen.update(kwargs)
+        return {"strategy": "same_day_alternate", "hotel_required": False}
+
+    monkeypatch.setattr(agents, "rebooking_tool", fake_rebooking_tool)
+
+    state = DisruptionState(
+        input_data={"carrier": carrier, "stats": {"paxImpacted": 100}},
+        disruption_detected=True,
+    )
+    await RebookingAgent().draft(state)
+
+    assert seen["vip_count"] == expected
+
+
 @pytest.mark.asyncio
 async def test_finance_agent_merges_tool_result(monkeypatch: pytest.MonkeyPatch) -> None:
     async def fake_finance_tool(**_: object) -> dict:
@@ -192,6 +222,7 @@ async def test_finance_agent_merges_tool_result(monkeypatch: pytest.MonkeyPatch)
 
     state = DisruptionState(
         input_data={},
+        disruption_detected=True,
         rebooking_plan={"estimated_pax": 50, "hotel_required": True},
         risk_assessment={"duration_minutes": 180},
     )
@@ -224,6 +255,7 @@ async def test_crew_agent_uses_tool_plan(monkeypatch: pytest.MonkeyPatch) -> Non
 
     state = DisruptionState(
         input_data={"flights": [{"id": "CX888"}]},
+        disruption_detected=True,
         risk_assessment={"duration_minutes": 200},
     )
 
@@ -236,6 +268,34 @@ async def test_crew_agent_uses_tool_plan(monkeypatch: pytest.MonkeyPatch) -> Non
     assert new_state.audit_log and new_state.audit_log[-1]["agent"] == "CrewAgent"
 
 
+@pytest.mark.asyncio
+async def test_crew_agent_refines_tool_plan_with_crew_prompt(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_crew_tool(**_: object) -> dict:
+        return {"crew_changes_needed": True, "backup_crew_required": 2, "actions": []}
+
+    prompts = []
+
+    async def fake_llm_json(self: LLMBackedAgent, prompt: list) -> dict:
+        prompts.append(prompt)
+        return {"backup_crew_required": 3}
+
+    monkeypatch.setattr(agents, "crew_scheduling_tool", fake_crew_tool)
+    monkeypatch.setattr(LLMBackedAgent, "_invoke_llm_json", fake_llm_json)
+
+    state = DisruptionState(
+        input_data={"flights": [{"id": "CX888"}], "stats": {"delayed": 1}},
+        disruption_detected=True,
+        risk_assessment={"duration_minutes": 200},
+    )
+
+    new_state = await CrewAgent().run(state)
+
+    assert new_state.crew_rotation["backup_crew_required"] == 3
+    assert "Flight Stats:" in prompts[0][-1].content
+
+
 @pytest.mark.asyncio
 async def test_aggregator_agent_builds_final_plan() -> None:
     state = DisruptionState(
@@ -258,3 +318,236 @@ async def test_aggregator_agent_builds_final_plan() -> None:
     assert plan["recommended_action"] in {"PROCEED", "MONITOR"}
     assert plan["priority"] in {"high", "critical", "medium"}
     assert new_state.audit_log and new_state.audit_log[-1]["agent"] == "AggregatorAgent"
+    # Sub-agent plans are audited by their own agents, not repeated here.
+    audited = new_state.audit_log[-1]
+    assert audited["input"] == {
+        "scenarios": [scenario["scenario"] for scenario in new_state.simulation_results]
+    }
+    assert audited["output"]["priority"] == plan["priority"]
+    assert "rebooking_plan" not in audited["output"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"likelihood": 0.7}',
+        '```json\n{"likelihood": 0.7}\n```',
+        '```\n{"likelihood": 0.7}\n```',
+        'Here is the plan:\n```json\n{"likelihood": 0.7}\n```\nThanks',
+    ],
+)
+def test_parse_json_block_handles_fenced_and_bare_json(text: str) -> None:
+    assert agents._parse_json_block(text) == {"likelihood": 0.7}
+
+
+def test_parse_json_block_returns_none_for_invalid_json() -> None:
+    assert agents._parse_json_block("```json\nnot json\n```") is None
+
+
+@pytest.mark.asyncio
+async def test_invoke_llm_json_reuses_cached_reply(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    class FakeLLM:
+        async def ainvoke(self, messages, **kwargs):
+            calls.append(messages)
+
+            class Reply:
+                content = '{"likelihood": 0.4}'
+
+            return Reply()
+
+    monkeypatch.setattr(agents, "_LLM_RESPONSE_CACHE", agents.TTLCache(maxsize=8, ttl=60))
+    agent = RiskAgent()
+    monkeypatch.setattr(agents, "_shared_llm", lambda: FakeLLM())
+
+    messages = agent._risk_prompt({"risk_probability": 0.4})
+    first = await agent._invoke_llm_json(messages)
+    second = await agent._invoke_llm_json(agent._risk_prompt({"risk_probability": 0.4}))
+
+    assert first == second == {"likelihood": 0.4}
+    assert first is not second
+    assert len(calls) == 1
+
+    monkeypatch.setattr(RiskAgent, "cache_llm_replies", False)
+    await agent._invoke_llm_json(messages)
+    assert len(calls) == 2
+
+
+def test_prompts_put_static_instructions_first() -> None:
+    first = RiskAgent()._risk_prompt({"risk_probability": 0.4})
+    second = RiskAgent()._risk_prompt({"risk_probability": 0.9})
+
+    assert first[0].content == second[0].content
+    assert first[1].content != second[1].content
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_and_stops_once_json_closes(monkeypatch: pytest.MonkeyPatch) -> None:
+    pulled = []
+    chunks = ['```json\n{"severity": "high", ', '"reasoning": "brace } in text"', "}\n```", " trailing", " tokens"]
+
+    class Chunk:
+        def __init__(self, content: str) -> None:
+            self.content = content
+
+    class FakeLLM:
+        async def astream(self, messages, **kwargs):
+            for piece in chunks:
+                pulled.append(piece)
+                yield Chunk(piece)
+
+    monkeypatch.setattr(agents, "_LLM_RESPONSE_CACHE", agents.TTLCache(maxsize=8, ttl=60))
+    agent = OrchestratorAgent()
+    monkeypatch.setattr(agents, "_shared_llm", lambda: FakeLLM())
+
+    result = await agent._invoke_llm_json(agent._orchestrator_prompt(DisruptionState()))
+
+    assert result == {"severity": "high", "reasoning": "brace } in text"}
+    assert pulled == chunks[:3]
+
+
+@pytest.mark.asyncio
+async def test_invoke_llm_json_falls_back_on_provider_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+
+    class FakeLLM:
+        async def ainvoke(self, messages, **kwargs):
+            raise httpx.ReadTimeout("provider timed out")
+
+    monkeypatch.setattr(agents, "_LLM_RESPONSE_CACHE", agents.TTLCache(maxsize=8, ttl=60))
+    agent = RiskAgent()
+    monkeypatch.setattr(agents, "_shared_llm", lambda: FakeLLM())
+
+    assert await agent._invoke_llm_json(agent._risk_prompt({"risk_probability": 0.4})) is None
+
+
+@pytest.mark.asyncio
+async def test_risk_agent_falls_back_on_unlisted_provider_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    class ProviderError(Exception):
+        pass
+
+    class FakeLLM:
+        async def ainvoke(self, messages, **kwargs):
+            raise ProviderError("unexpected provider reply")
+
+    monkeypatch.setattr(agents, "_LLM_RESPONSE_CACHE", agents.TTLCache(maxsize=8, ttl=60))
+    monkeypatch.setattr(agents, "_shared_llm", lambda: FakeLLM())
+
+    new_state = await RiskAgent().run(
+        DisruptionState(input_data={}, risk_assessment={"risk_probability": 0.7})
+    )
+
+    ra = new_state.risk_assessment
+    assert 0.0 <= ra["likelihood"] <= 1.0
+    assert ra["pax_impact"] in {"low", "medium", "high"}
+
+
+@pytest.mark.asyncio
+async def test_sub_agents_stream_replies(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Chunk:
+        content = '{"likelihood": 0.6}'
+
+    class FakeLLM:
+        async def astream(self, messages, **kwargs):
+            yield Chunk()
+
+        async def ainvoke(self, messages, **kwargs):  # pragma: no cover - must not be used
+            raise AssertionError("expected a streamed call")
+
+    monkeypatch.setattr(agents, "_LLM_RESPONSE_CACHE", agents.TTLCache(maxsize=8, ttl=60))
+    agent = RiskAgent()
+    monkeypatch.setattr(agents, "_shared_llm", lambda: FakeLLM())
+
+    assert await agent._invoke_llm_json(agent._risk_prompt({"risk_probability": 0.6})) == {"likelihood": 0.6}
+
+
+@pytest.mark.asyncio
+async def test_agents_share_one_llm_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    built = []
+
+    def fake_builder(*args: object) -> object:
+        built.append(object())
+        return built[-1]
+
+    monkeypatch.setattr(llm, "_BUILDERS", {"gemini": fake_builder})
+    monkeypatch.setattr(llm, "_LOOP_LLMS", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(llm.settings, "llm_provider", "gemini", raising=False)
+    monkeypatch.setattr(llm.settings, "gemini_api_key", "key", raising=False)
+    monkeypatch.setattr(agents, "_SHARED_LLM_FAILED", False)
+
+    assert RiskAgent()._ensure_llm() is CrewAgent()._ensure_llm()
+    assert len(built) == 1
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2025-12-01T10:00:00Z", "2025-12-01"),
+        ("2025-12-01", "2025-12-01"),
+        ("20251201T1000", "2025-12-01"),
+        ("12/01/2025", None),
+        ("abcd-ef-gh", None),
+        (None, None),
+    ],
+)
+def test_iso_date_prefix(value: object, expected: str | None) -> None:
+    assert agents._iso_date_prefix(value) == expected
+
+
+def test_render_scenarios_attaches_global_and_matching_decisions_in_order() -> None:
+    state = DisruptionState(
+        what_if_templates=[{"scenario": "delay_3hr"}, {"scenario": "crew_unavailable"}],
+        decision_log=[
+            {"decision": "a", "scenarios": ["delay_3hr"]},
+            {"decision": "b", "scenarios": ["global"]},
+            {"decision": "c", "scenarios": ["crew_unavailable", "delay_3hr"]},
+            {"decision": "d", "scenarios": ["other"]},
+        ],
+    )
+
+    rendered = {r["scenario"]: [d["decision"] for d in r["agent_decisions"]] for r in agents._render_scenarios(state)}
+
+    assert rendered == {"delay_3hr": ["a", "b", "c"], "crew_unavailable": ["b", "c"]}
+
+
+@pytest.mark.asyncio
+async def test_sync_only_llm_runs_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    threads = []
+
+    class SyncLLM:
+        def invoke(self, messages, **kwargs):
+            threads.append(threading.current_thread())
+
+            class Reply:
+                content = '{"likelihood": 0.5}'
+
+            return Reply()
+
+    monkeypatch.setattr(agents, "_LLM_RESPONSE_CACHE", agents.TTLCache(maxsize=8, ttl=60))
+    agent = RiskAgent()
+    monkeypatch.setattr(agents, "_shared_llm", lambda: SyncLLM())
+
+    assert await agent._invoke_llm_json(agent._risk_prompt({"risk_probability": 0.5})) == {"likelihood": 0.5}
+    assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.parametrize(
+    ("risk_prob", "severity", "duration", "pax_impact"),
+    [
+        (0.4, "low", 120, "low"),
+        (0.41, "medium", 120, "low"),
+        (0.6, "medium", 120, "medium"),
+        (0.7, "high", 180, "medium"),
+        (0.8, "high", 180, "high"),
+        (0.81, "critical", 240, "high"),
+    ],
+)
+def test_risk_bands_treat_thresholds_as_exclusive(
+    risk_prob: float, severity: str, duration: int, pax_impact: str
+) -> None:
+    assert OrchestratorAgent()._calculate_severity(risk_prob) == severity
+    assert RiskAgent._estimate_duration(risk_prob) == duration
+    assert RiskAgent._assess_pax_impact(risk_prob) == pax_impact
@@ -0,0 +1,273 @@
+import asyncio
+
+import pytest
+
+from app.agentsv2 import amadeus_tools
+from app.agentsv2.amadeus_tools import comprehensive_reaccommodation_tool
+
+
+def _flight_results() -> dict:
+    return {
+        "alternatives": [
+            {
+                "flight_number": "CX880",
+                "price": {"total": 500.0},
+                "departure": {"time": "2025-12-02T09:00"},
+            }
+        ],
+        "count": 1,
+        "search_params": {},
+    }
+
+
+def _hotel_results() -> dict:
+    return {
+        "hotels": [{"name": "Airport Hotel", "price": {"total": 150.0}}],
+        "count": 1,
+        "total_cost": 300.0,
+        "search_params": {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_reaccommodation_searches_flights_and_hotels_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    active = peak = 0
+
+    async def track() -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    async def fake_flights(**_: object) -> dict:
+        await track()
+        return _flight_results()
+
+    async def fake_hotels(**_: object) -> dict:
+        await track()
+        return _hotel_results()
+
+    monkeypatch.setattr(amadeus_tools, "search_alternative_flights_tool", fake_flights)
+    monkeypatch.setattr(amadeus_tools, "search_hotels_tool", fake_hotels)
+
+    result = await comprehensive_reaccommodation_tool(
+        origin="HKG",
+        destination="LAX",
+        original_departure_date="2025-12-01",
+        passenger_count=4,
+        delay_minutes=240,
+    )
+
+    assert peak == 2
+    assert result["needs_hotel"] is True
+    assert result["hotel_options"]["count"] == 1
+    assert result["total_cost_estimate"] == 300.0 + 500.0 * 4
+    assert [action["type"] for action in result["recommended_plan"]["actions"]] == [
+        "rebook_flight",
+        "book_hotel",
+        "notify_passengers",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reaccommodation_keeps_flights_when_hotel_search_raises(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_flights(**_: object) -> dict:
+        return _flight_results()
+
+    async def failing_hotels(**_: object) -> dict:
+        raise RuntimeError("hotel service down")
+
+    monkeypatch.setattr(amadeus_tools, "search_alternative_flights_tool", fake_flights)
+    monkeypatch.setattr(amadeus_tools, "search_hotels_tool", failing_hotels)
+
+    result = await comprehensive_reaccommodation_tool(
+        origin="HKG",
+        destination="LAX",
+        original_departure_date="2025-12-01",
+        passenger_count=4,
+        vip_count=2,
+        delay_minutes=240,
+    )
+
+    assert "error" not in result
+    assert result["flight_options"]["count"] == 1
+    assert result["hotel_options"]["count"] == 0
+    assert "hotel service down" in result["hotel_options"]["error"]
+    assert result["total_cost_estimate"] == 500.0 * 4
+    assert [action["type"] for action in result["recommended_plan"]["actions"]] == [
+        "vip_priority",
+        "rebook_flight",
+        "notify_passengers",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_flight_search_reuses_cached_offers_until_a_booking(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+
+    class FakeClient:
+        async def search_flight_offers(self, **kwargs: object) -> list:
+            calls.append(kwargs)
+            return [{"id": "1"}] if len(calls) > 1 else []
+
+        def parse_flight_offer(self, offer: dict) -> dict:
+            return {"flight_number": "CX880", "price": {"total": 500.0}}
+
+    monkeypatch.setattr(amadeus_tools, "get_amadeus_client", FakeClient)
+    amadeus_tools.invalidate_search_cache()
+
+    async def search() -> dict:
+        return await amadeus_tools.search_alternative_flights_tool(
+            origin="HKG", destination="LAX", departure_date="2025-12-02"
+        )
+
+    # Empty answers may be swallowed API errors, so they are not cached
+    assert (await search())["count"] == 0
+    assert (await search())["count"] == 1
+    assert (await search())["count"] == 1
+    assert len(calls) == 2
+
+    amadeus_tools.invalidate_search_cache()
+    await search()
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_flight_search_reports_price_range(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeClient:
+        async def search_flight_offers(self, **_: object) -> list:
+            return [{"total": 620.0}, {"total": 480.5}, {"total": 550.0}]
+
+        def parse_flight_offer(self, offer: dict) -> dict:
+            return {"flight_number": "CX880", "price": {"total": offer["total"]}}
+
+    monkeypatch.setattr(amadeus_tools, "get_amadeus_client", FakeClient)
+    amadeus_tools.invalidate_search_cache()
+
+    result = await amadeus_tools.search_alternative_flights_tool(
+        origin="HKG", destination="SFO", departure_date="2025-12-03"
+    )
+
+    assert result["count"] == 3
+    assert "from $480.50 to $620.00" in result["reasoning"]
+
+
+@pytest.mark.asyncio
+async def test_book_flight_builds_mock_travelers(monkeypatch: pytest.MonkeyPatch) -> None:
+    ordered = []
+
+    class FakeClient:
+        async def price_flight_offer(self, offer: dict) -> dict:
+            return {**offer, "price": {"total": "500.00", "currency": "USD"}}
+
+        async def create_flight_order(self, priced: dict, travelers: list) -> dict:
+            ordered.extend(travelers)
+            return {"id": "order-1", "associatedRecords": [{"reference": "ABC123"}]}
+
+    monkeypatch.setattr(amadeus_tools, "get_amadeus_client", FakeClient)
+
+    result = await amadeus_tools.book_flight_tool(
+        {"flight_number": "CX880", "raw_offer": {"id": "1"}}, passenger_count=12
+    )
+
+    assert result["success"] is True
+    assert result["pnr"] == "ABC123"
+    assert result["confirmation"]["passengers_booked"] == 9
+    assert [traveler["id"] for traveler in ordered] == [str(i) for i in range(1, 10)]
+    assert ordered[0]["name"]["firstName"] == "PASSENGER1"
+    assert ordered[8]["contact"]["emailAddress"] == "passenger9@cathay.com"
+
+
+@pytest.mark.asyncio
+async def test_book_flight_reports_missing_pnr(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeClient:
+        async def price_flight_offer(self, offer: dict) -> dict:
+            return offer
+
+        async def create_flight_order(self, priced: dict, travelers: list) -> dict:
+            return {"id": "order-1", "associatedRecords": []}
+
+    monkeypatch.setattr(amadeus_tools, "get_amadeus_client", FakeClient)
+
+    result = await amadeus_tools.book_flight_tool({"id": "1"}, passenger_count=1)
+
+    assert result["success"] is True
+    assert result["pnr"] == "N/A"
+    assert result["confirmation"]["total_price"] is None
+
+
+@pytest.mark.asyncio
+async def test_flight_search_stops_parsing_at_max_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    parsed = []
+
+    class FakeClient:
+        async def search_flight_offers(self, **_: object) -> list:
+            return [{"total": float(price)} for price in range(400, 800, 100)]
+
+        def parse_flight_offer(self, offer: dict) -> dict:
+            parsed.append(offer)
+            return {"flight_number": "CX880", "price": {"total": offer["total"]}}
+
+    monkeypatch.setattr(amadeus_tools, "get_amadeus_client", FakeClient)
+    amadeus_tools.invalidate_search_cache()
+
+    result = await amadeus_tools.search_alternative_flights_tool(
+        origin="HKG", destination="YVR", departure_date="2025-12-04", max_results=2
+    )
+
+    assert result["count"] == 2
+    assert len(parsed) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("destination", "city_code"), [("JFK", "NYC"), ("NRT", "TYO"), ("LAX", "LAX")]
+)
+async def test_reaccommodation_searches_hotels_by_city(
+    monkeypatch: pytest.MonkeyPatch, destination: str, city_code: str
+) -> None:
+    searched = []
+
+    async def fake_flights(**_: object) -> dict:
+        return _flight_results()
+
+    async def fake_hotels(**kwargs: object) -> dict:
+        searched.append(kwargs["city_code"])
+        return _hotel_results()
+
+    monkeypatch.setattr(amadeus_tools, "search_alternative_flights_tool", fake_flights)
+    monkeypatch.setattr(amadeus_tools, "search_hotels_tool", fake_hotels)
+
+    await comprehensive_reaccommodation_tool(
+        origin="HKG",
+        destination=destination,
+        original_departure_date="2025-12-01",
+        passenger_count=2,
+        delay_minutes=240,
+    )
+
+    assert searched == [city_code]
+
+
+def test_amadeus_client_closes_pool_from_previous_loop() -> None:
+    from app.services.amadeus_client import AmadeusClient
+
+    client = AmadeusClient(client_id="id", client_secret="secret")
+    first_loop = asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(client._http_client())
+        second = asyncio.run(client._http_client())
+
+        assert first.is_closed
+        assert second is not first
+    finally:
+        first_loop.close()
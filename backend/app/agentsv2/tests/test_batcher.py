@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.agentsv2.batcher import LLMBatcher
+
+
+class Message:
+    def __init__(self, content: str, type: str = "human") -> None:
+        self.content = content
+        self.type = type
+
+
+class FakeLLM:
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def ainvoke(self, messages, **kwargs):
+        self.calls.append(messages[0].content)
+        await asyncio.sleep(0)
+        return f"reply:{messages[0].content}"
+
+
+@pytest.mark.asyncio
+async def test_batcher_sends_identical_prompts_once() -> None:
+    batcher = LLMBatcher(max_batch=8, max_latency_ms=5)
+    llm = FakeLLM()
+
+    replies = await asyncio.gather(
+        batcher.submit(llm, [Message("a")]),
+        batcher.submit(llm, [Message("a")]),
+        batcher.submit(llm, [Message("b")]),
+    )
+
+    assert replies == ["reply:a", "reply:a", "reply:b"]
+    assert sorted(llm.calls) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_keeps_message_roles_apart() -> None:
+    batcher = LLMBatcher(max_batch=8, max_latency_ms=5)
+    llm = FakeLLM()
+
+    await asyncio.gather(
+        batcher.submit(llm, [Message("a", "system")]),
+        batcher.submit(llm, [Message("a", "human")]),
+    )
+
+    assert llm.calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_propagates_provider_errors() -> None:
+    class FailingLLM:
+        async def ainvoke(self, messages, **kwargs):
+            raise TimeoutError("provider timed out")
+
+    batcher = LLMBatcher(max_batch=8, max_latency_ms=1)
+
+    with pytest.raises(TimeoutError):
+        await batcher.submit(FailingLLM(), [Message("a")])
+
+
+def test_batcher_disabled_without_window() -> None:
+    assert not LLMBatcher(max_batch=16, max_latency_ms=0).enabled
+    assert LLMBatcher(max_batch=16, max_latency_ms=20).enabled
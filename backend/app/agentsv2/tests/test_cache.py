@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from app.agentsv2.cache import TTLCache, async_ttl_cache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries() -> None:
+    clock = FakeClock()
+    cache = TTLCache(maxsize=4, ttl=10, timer=clock)
+
+    cache.set("key", {"value": 1})
+    assert cache.get("key") == {"value": 1}
+
+    clock.now = 10.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_disabled_with_zero_ttl() -> None:
+    cache = TTLCache(maxsize=2, ttl=0)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_coalesces_concurrent_misses() -> None:
+    calls = []
+
+    @async_ttl_cache(maxsize=4, ttl=60, key=lambda value: value)
+    async def double(value: int) -> int:
+        calls.append(value)
+        await asyncio.sleep(0)
+        return value * 2
+
+    results = await asyncio.gather(double(2), double(2), double(3))
+    assert results == [4, 4, 6]
+    assert await double(2) == 4
+    assert calls == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_does_not_cache_failures() -> None:
+    calls = []
+
+    @async_ttl_cache(maxsize=4, ttl=60, key=lambda value: value)
+    async def flaky(value: int) -> int:
+        calls.append(value)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return value
+
+    with pytest.raises(RuntimeError):
+        await flaky(1)
+    assert await flaky(1) == 1
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_ttl_cache_skips_results_rejected_by_cache_if() -> None:
+    calls = []
+
+    @async_ttl_cache(maxsize=4, ttl=60, key=lambda value: value, cache_if=bool)
+    async def lookup(value: int) -> list:
+        calls.append(value)
+        return [value] if len(calls) > 1 else []
+
+    assert await lookup(1) == []
+    assert await lookup(1) == [1]
+    assert await lookup(1) == [1]
+    assert calls == [1, 1]
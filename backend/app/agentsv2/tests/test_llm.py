@@ -0,0 +1,91 @@
+import asyncio
+import weakref
+
+import pytest
+
+from app.agentsv2 import llm
+from app.agentsv2.llm import LLMProviderError, get_llm
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_cache():
+    llm._build_llm.cache_clear()
+    yield
+    llm._build_llm.cache_clear()
+
+
+def test_get_llm_reuses_client_for_same_configuration(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm.settings, "openai_api_key", "sk-test", raising=False)
+    monkeypatch.setattr(llm.settings, "llm_model", "gpt-4o", raising=False)
+    monkeypatch.setattr(llm.settings, "llm_temperature", 0.2, raising=False)
+
+    first = get_llm("openai")
+    second = get_llm("openai")
+
+    assert first is second
+
+    monkeypatch.setattr(llm.settings, "llm_temperature", 0.7, raising=False)
+    assert get_llm("openai") is not first
+
+
+def test_get_llm_builds_one_client_per_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm.settings, "gemini_api_key", "key", raising=False)
+    monkeypatch.setattr(llm, "_BUILDERS", {"gemini": lambda *args: object()})
+    monkeypatch.setattr(llm, "_LOOP_LLMS", weakref.WeakKeyDictionary())
+
+    async def build_twice() -> tuple[object, object]:
+        return get_llm("gemini"), get_llm("gemini")
+
+    first, again = asyncio.run(build_twice())
+    second, _ = asyncio.run(build_twice())
+
+    assert first is again
+    assert second is not first
+
+
+@pytest.mark.parametrize(
+    ("provider", "expected_base_url"),
+    [("deepseek", "https://llm.example.test"), ("gemini", None)],
+)
+def test_get_llm_passes_provider_settings_to_builder(
+    monkeypatch: pytest.MonkeyPatch, provider: str, expected_base_url: str | None
+) -> None:
+    calls = []
+    monkeypatch.setattr(llm.settings, f"{provider}_api_key", "key", raising=False)
+    monkeypatch.setattr(llm.settings, "deepseek_base_url", "https://llm.example.test", raising=False)
+    monkeypatch.setattr(
+        llm, "_BUILDERS", {provider: lambda *args: calls.append(args) or object()}
+    )
+
+    get_llm(provider)
+
+    assert calls[0][2:] == ("key", expected_base_url)
+
+
+def test_get_llm_rejects_unknown_provider() -> None:
+    with pytest.raises(LLMProviderError):
+        get_llm("unknown")
+
+
+@pytest.mark.asyncio
+async def test_warmup_llm_pings_configured_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    probes = []
+
+    class FakeLLM:
+        async def ainvoke(self, messages, **kwargs):
+            probes.append(kwargs)
+
+    monkeypatch.setattr(llm, "get_llm", lambda: FakeLLM())
+
+    assert await llm.warmup_llm() is True
+    assert probes == [{"max_tokens": 1}]
+
+
+@pytest.mark.asyncio
+async def test_warmup_llm_skips_unconfigured_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    def raise_provider_error():
+        raise LLMProviderError("missing key")
+
+    monkeypatch.setattr(llm, "get_llm", raise_provider_error)
+
+    assert await llm.warmup_llm() is False
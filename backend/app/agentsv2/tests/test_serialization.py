@@ -0,0 +1,22 @@
+from datetime import datetime
+
+import pytest
+
+from app.agentsv2.serialization import json_dumps, json_loads, msgpack_dumps
+
+
+def test_json_dumps_sort_keys_ignores_insertion_order() -> None:
+    first = json_dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True)
+    second = json_dumps({"a": {"c": 3, "d": 2}, "b": 1}, sort_keys=True)
+
+    assert first == second
+    assert json_loads(first) == {"a": {"c": 3, "d": 2}, "b": 1}
+
+
+def test_msgpack_dumps_round_trips_and_stringifies_unknown_types() -> None:
+    msgpack = pytest.importorskip("msgpack")
+    stamp = datetime(2025, 12, 1, 10, 0)
+
+    packed = msgpack_dumps({"plan": {"priority": "high"}, "at": stamp})
+
+    assert msgpack.unpackb(packed) == {"plan": {"priority": "high"}, "at": str(stamp)}
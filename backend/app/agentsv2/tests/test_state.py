@@ -0,0 +1,55 @@
+from app.agentsv2.state import AuditLog, DisruptionState, get_flight_summary, log_reasoning
+
+
+def test_log_reasoning_stores_detached_snapshot() -> None:
+    state = DisruptionState()
+    output = {"risk_probability": 0.7}
+
+    log_reasoning(state, "PredictiveAgent", {"airport": "HKG"}, output)
+    output["likelihood"] = 0.9
+
+    entry = state.audit_log[-1]
+    assert entry["agent"] == "PredictiveAgent"
+    assert entry["output"] == {"risk_probability": 0.7}
+    assert state.audit_log.to_list() == [entry]
+
+
+def test_audit_log_keeps_newest_entries_when_full() -> None:
+    log = AuditLog(maxlen=2)
+
+    ids = [log.append({"agent": name}) for name in ("A", "B", "C")]
+
+    assert ids == [0, 1, 2]
+    assert [entry["agent"] for entry in log] == ["B", "C"]
+    assert log.dropped == 1
+
+
+def test_state_accepts_plain_list_audit_log() -> None:
+    state = DisruptionState(audit_log=[{"agent": "Seed"}])
+
+    assert isinstance(state.audit_log, AuditLog)
+    assert state.audit_log[0] == {"agent": "Seed"}
+
+
+def test_flight_summary_is_computed_once_per_run() -> None:
+    state = DisruptionState(
+        input_data={
+            "airport": "HKG",
+            "stats": {"paxImpacted": 120},
+            "flights": [
+                {"id": "CX1", "statusCategory": "critical"},
+                {"id": "CX2", "statusCategory": "normal"},
+            ],
+        }
+    )
+
+    summary = get_flight_summary(state)
+
+    assert summary["critical_count"] == 1
+    assert summary["first_critical"]["id"] == "CX1"
+    assert summary["flight_count"] == 2
+    critical = summary["flights_by_status"]["critical"]
+    assert critical.ids == ["CX1"]
+    assert critical.routes == [None]
+    assert '"paxImpacted"' in summary["stats_json"]
+    assert get_flight_summary(state) is summary
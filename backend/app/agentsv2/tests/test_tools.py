@@ -1,3 +1,6 @@
+import asyncio
+import weakref
+
 import pytest
 
 from app.agentsv2 import tools
@@ -24,6 +27,58 @@ async def test_predictive_signal_tool_returns_risk_fields() -> None:
     assert 0.0 <= result["risk_probability"] <= 1.0
 
 
+@pytest.mark.asyncio
+async def test_predictive_signal_tool_reuses_cached_signals(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+    real_compute = tools.compute_predictive_signals
+
+    def spy_compute(data: dict) -> dict:
+        calls.append(data)
+        return real_compute(data)
+
+    monkeypatch.setattr(tools, "compute_predictive_signals", spy_compute)
+    tools._cached_signals.cache.clear()
+    kwargs = dict(airport="SIN", carrier="SQ", weather_score=0.2, aircraft_score=0.2, crew_score=0.2)
+
+    first = await predictive_signal_tool(**kwargs)
+    first["signal_breakdown"]["weather"] = "mutated"
+    second = await predictive_signal_tool(**kwargs)
+
+    assert len(calls) == 1
+    assert second["signal_breakdown"]["weather"] != "mutated"
+
+
+@pytest.mark.asyncio
+async def test_predictive_signal_tool_keys_payload_on_scorer_inputs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+    real_compute = tools.compute_predictive_signals
+
+    def spy_compute(data: dict) -> dict:
+        calls.append(data)
+        return real_compute(data)
+
+    monkeypatch.setattr(tools, "compute_predictive_signals", spy_compute)
+    tools._cached_signals.cache.clear()
+    flight = {"flightNumber": "SQ1", "crewReady": True, "aircraftReady": True}
+    payload = {"airport": "SIN", "carrier": "SQ", "stats": {"delayed": 3}, "alerts": [], "flights": [flight]}
+    kwargs = dict(airport="SIN", carrier="SQ", weather_score=0.2, aircraft_score=0.2, crew_score=0.2)
+
+    await predictive_signal_tool(**kwargs, payload=payload)
+    # Fields the scorers ignore do not change the key
+    renamed = {**payload, "flights": [{**flight, "flightNumber": "SQ2"}]}
+    await predictive_signal_tool(**kwargs, payload=renamed)
+    assert len(calls) == 1
+
+    grounded = {**payload, "flights": [{**flight, "crewReady": False}]}
+    await predictive_signal_tool(**kwargs, payload=grounded)
+    assert len(calls) == 2
+    assert "weatherScore" not in payload["stats"]
+
+
 @pytest.mark.asyncio
 async def test_rebooking_tool_synthetic_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
     # Force synthetic mode regardless of Amadeus availability
@@ -99,6 +154,49 @@ async def test_rebooking_tool_uses_amadeus_when_configured(monkeypatch: pytest.M
     assert result["total_cost_estimate"] == 123456.0
 
 
+@pytest.mark.asyncio
+async def test_rebooking_tool_bounds_concurrent_amadeus_searches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tools, "AMADEUS_AVAILABLE", True, raising=False)
+    monkeypatch.setattr(tools.settings, "amadeus_client_id", "dummy", raising=False)
+    monkeypatch.setattr(tools.settings, "amadeus_client_secret", "dummy", raising=False)
+    monkeypatch.setattr(tools.settings, "amadeus_max_concurrency", 2, raising=False)
+    monkeypatch.setattr(tools, "_AMADEUS_SLOTS", weakref.WeakKeyDictionary())
+
+    active = peak = 0
+
+    async def slow_reaccommodation(**_: object) -> dict:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {
+            "flight_options": {"alternatives": [], "count": 0},
+            "hotel_options": None,
+            "recommended_plan": {"strategy": "same_day_alternate", "actions": []},
+            "total_cost_estimate": 0.0,
+        }
+
+    monkeypatch.setattr(tools, "comprehensive_reaccommodation_tool", slow_reaccommodation)
+
+    results = await asyncio.gather(
+        *(
+            rebooking_tool(
+                flight_id=f"CX{i}",
+                pax_count=10,
+                delay_minutes=90,
+                departure_date="2025-12-01",
+            )
+            for i in range(5)
+        )
+    )
+
+    assert peak == 2
+    assert {result["data_source"] for result in results} == {"amadeus"}
+
+
 @pytest.mark.asyncio
 async def test_finance_tool_produces_consistent_totals() -> None:
     result = await finance_tool(
@@ -117,6 +215,17 @@ async def test_finance_tool_produces_consistent_totals() -> None:
     assert isinstance(result["breakdown"], list) and result["breakdown"]
 
 
+@pytest.mark.asyncio
+async def test_finance_tool_is_deterministic() -> None:
+    kwargs = dict(pax_count=100, delay_minutes=200, hotel_required=True, flight_distance="long")
+
+    first = await finance_tool(**kwargs)
+    second = await finance_tool(**kwargs)
+
+    assert first == second
+    assert first["compensation_usd"] == 100 * 600
+
+
 @pytest.mark.asyncio
 async def test_crew_scheduling_tool_flags_changes_for_long_delays() -> None:
     result = await crew_scheduling_tool(
@@ -1,6 +1,7 @@
 import pytest
 
 from app.agentsv2 import agents
+from app.agentsv2 import workflow as workflow_mod
 from app.agentsv2.workflow import DisruptionWorkflowADK
 from app.agentsv2 import tools as tools_mod
 
@@ -83,3 +84,169 @@ async def test_workflow_runs_full_pipeline_on_disruption(
     assert result["finance_estimate"]
     assert result["crew_rotation"]
     assert result["audit_log"]
+
+
+@pytest.mark.asyncio
+async def test_workflow_batches_subagents_into_one_llm_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_predictive_signal_tool(**_: object) -> dict:
+        return {
+            "disruption_detected": True,
+            "risk_probability": 0.9,
+            "signal_breakdown": {},
+        }
+
+    calls = []
+
+    async def fake_llm_json(self: agents.LLMBackedAgent, prompt: object) -> dict | None:
+        calls.append(self.name)
+        if self.name != "SubAgentBatch":
+            return None
+        return {
+            "risk": {"likelihood": 0.85, "duration_minutes": 240, "pax_impact": "high"},
+            "rebooking": {"strategy": "partner_airline"},
+            "finance": {"reasoning": "Batched finance review"},
+            "crew": {"reasoning": "Batched crew review"},
+        }
+
+    monkeypatch.setattr(agents, "predictive_signal_tool", fake_predictive_signal_tool)
+    monkeypatch.setattr(agents.LLMBackedAgent, "_invoke_llm_json", fake_llm_json)
+    monkeypatch.setattr(tools_mod, "AMADEUS_AVAILABLE", False, raising=False)
+    monkeypatch.setattr(workflow_mod.settings, "llm_batch_subagents", True, raising=False)
+
+    workflow = DisruptionWorkflowADK()
+    result = await workflow.run(
+        {
+            "airport": "HKG",
+            "carrier": "CX",
+            "stats": {"paxImpacted": 120},
+            "flights": [{"id": "CX888", "statusCategory": "critical"}],
+            "alerts": [],
+        }
+    )
+
+    assert calls.count("SubAgentBatch") == 1
+    assert not {"RiskAgent", "RebookingAgent", "FinanceAgent", "CrewAgent"} & set(calls)
+    assert result["risk_assessment"]["duration_minutes"] == 240
+    assert result["rebooking_plan"]["strategy"] == "partner_airline"
+    assert result["finance_estimate"]["reasoning"] == "Batched finance review"
+    assert result["crew_rotation"]["reasoning"] == "Batched crew review"
+
+
+@pytest.mark.asyncio
+async def test_workflow_skips_finance_and_crew_llm_on_low_risk(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_predictive_signal_tool(**_: object) -> dict:
+        # Detected through the critical-flight ratio despite a weak signal.
+        return {
+            "disruption_detected": True,
+            "risk_probability": 0.3,
+            "signal_breakdown": {},
+        }
+
+    calls = []
+
+    async def fake_llm_json(self: agents.LLMBackedAgent, prompt: object) -> None:
+        calls.append(self.name)
+        return None
+
+    monkeypatch.setattr(agents, "predictive_signal_tool", fake_predictive_signal_tool)
+    monkeypatch.setattr(agents.LLMBackedAgent, "_invoke_llm_json", fake_llm_json)
+    monkeypatch.setattr(tools_mod, "AMADEUS_AVAILABLE", False, raising=False)
+
+    workflow = DisruptionWorkflowADK()
+    result = await workflow.run(
+        {"airport": "HKG", "carrier": "CX", "stats": {}, "flights": [], "alerts": []}
+    )
+
+    assert "FinanceAgent" not in calls and "CrewAgent" not in calls
+    assert result["finance_estimate"]["total_usd"] > 0
+    assert "crew_changes_needed" in result["crew_rotation"]
+
+
+@pytest.mark.asyncio
+async def test_workflow_sizes_rebooking_and_crew_from_risk_agent(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_predictive_signal_tool(**_: object) -> dict:
+        return {
+            "disruption_detected": True,
+            "risk_probability": 0.9,
+            "signal_breakdown": {},
+        }
+
+    async def fake_llm_json(self: agents.LLMBackedAgent, prompt: object) -> None:
+        return None
+
+    delays = {}
+    real_rebooking_tool = agents.rebooking_tool
+    real_crew_tool = agents.crew_scheduling_tool
+
+    async def spy_rebooking_tool(**kwargs: object) -> dict:
+        delays["rebooking"] = kwargs["delay_minutes"]
+        return await real_rebooking_tool(**kwargs)
+
+    async def spy_crew_tool(**kwargs: object) -> dict:
+        delays["crew"] = kwargs["delay_minutes"]
+        return await real_crew_tool(**kwargs)
+
+    monkeypatch.setattr(agents, "predictive_signal_tool", fake_predictive_signal_tool)
+    monkeypatch.setattr(agents, "rebooking_tool", spy_rebooking_tool)
+    monkeypatch.setattr(agents, "crew_scheduling_tool", spy_crew_tool)
+    monkeypatch.setattr(agents.LLMBackedAgent, "_invoke_llm_json", fake_llm_json)
+    monkeypatch.setattr(tools_mod, "AMADEUS_AVAILABLE", False, raising=False)
+
+    result = await DisruptionWorkflowADK().run(
+        {"airport": "HKG", "carrier": "CX", "stats": {}, "flights": [], "alerts": []}
+    )
+
+    # The risk agent's heuristic puts a 0.9 probability at four hours.
+    assert result["risk_assessment"]["duration_minutes"] == 240
+    assert delays == {"rebooking": 240, "crew": 240}
+
+
+def test_workflow_instances_share_agent_pipeline() -> None:
+    first = DisruptionWorkflowADK()
+    second = DisruptionWorkflowADK()
+
+    assert first.orchestrator_agent is second.orchestrator_agent
+    assert first.subagent_batch.risk_agent is second.risk_agent
+
+
+@pytest.mark.asyncio
+async def test_workflow_reprices_finance_when_rebooking_llm_changes_plan(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_predictive_signal_tool(**_: object) -> dict:
+        return {
+            "disruption_detected": True,
+            "risk_probability": 0.9,
+            "signal_breakdown": {},
+        }
+
+    async def fake_llm_json(self: agents.LLMBackedAgent, prompt: object) -> dict | None:
+        if self.name == "RebookingAgent":
+            return {"estimated_pax": 50}
+        return None
+
+    priced = []
+    real_finance_tool = agents.finance_tool
+
+    async def spy_finance_tool(**kwargs: object) -> dict:
+        priced.append(kwargs["pax_count"])
+        return await real_finance_tool(**kwargs)
+
+    monkeypatch.setattr(agents, "predictive_signal_tool", fake_predictive_signal_tool)
+    monkeypatch.setattr(agents, "finance_tool", spy_finance_tool)
+    monkeypatch.setattr(agents.LLMBackedAgent, "_invoke_llm_json", fake_llm_json)
+    monkeypatch.setattr(tools_mod, "AMADEUS_AVAILABLE", False, raising=False)
+
+    result = await DisruptionWorkflowADK().run(
+        {"airport": "HKG", "carrier": "CX", "stats": {"paxImpacted": 120}, "flights": [], "alerts": []}
+    )
+
+    # Pre-estimate from the tool plan, then a re-price for the refined count.
+    assert priced == [120, 50]
+    assert result["finance_estimate"]["compensation_usd"] == 50 * 400
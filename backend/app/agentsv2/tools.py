@@ -4,12 +4,15 @@ These tools implement domain-specific functionality for flight disruption
 management, including predictive signals, rebooking, finance, and crew scheduling.
 """
 
+import asyncio
 import logging
-import random
+import weakref
 from typing import Any, Dict, List
 
-from ..services.predictive_signals import compute_predictive_signals
+from ..services.predictive_signals import compute_predictive_signals, signal_inputs
 from ..config import settings
+from .cache import async_ttl_cache
+from .serialization import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +28,33 @@ except ImportError:
     AMADEUS_AVAILABLE = False
     logger.warning("Amadeus tools not available - falling back to synthetic data")
 
+# EU261/HKCAD per-passenger compensation for delays of three hours or more
+_LONG_DELAY_COMP_USD = {"long": 600, "medium": 400, "short": 250}
+_SHORT_DELAY_COMP_USD = 125  # two to three hours
+_HOTEL_MEALS_PER_PAX_USD = 150  # Average hotel + meals
+# Fixed operational overhead (fuel, crew overtime, etc.). Kept deterministic so
+# identical inputs give identical estimates and cached replies stay valid.
+_OPERATIONAL_USD = 20_000
+
+# One semaphore per event loop (run_sync() starts a fresh loop per call).
+_AMADEUS_SLOTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _amadeus_slots() -> asyncio.Semaphore:
+    """Semaphore bounding concurrent Amadeus searches on the running loop.
+    
+    Concurrent workflow runs each fan out flight and hotel searches; the
+    bound keeps a burst within the API's rate limit instead of failing
+    over to synthetic data.
+    """
+    loop = asyncio.get_running_loop()
+    slots = _AMADEUS_SLOTS.get(loop)
+    if slots is None:
+        slots = _AMADEUS_SLOTS[loop] = asyncio.Semaphore(settings.amadeus_max_concurrency)
+    return slots
+
 
 # Tool decorator for ADK compatibility
 # Note: ADK expects async functions for tools
@@ -55,6 +85,63 @@ async def predictive_signal_tool(
             - signal_breakdown: Individual signal scores
             - likelihood: Risk category
     """
+    # Cached serialized, so each caller gets its own copy to mutate.
+    result = json_loads(
+        await _cached_signals(
+            airport, carrier, weather_score, aircraft_score, crew_score, payload
+        )
+    )
+    
+    logger.info(
+        "🎯 Predictive Tool: Risk=%.2f%%, Detected=%s",
+        result["risk_probability"] * 100,
+        result["disruption_detected"],
+    )
+    
+    return result
+
+
+def _signal_cache_key(
+    airport: str,
+    carrier: str,
+    weather_score: float,
+    aircraft_score: float,
+    crew_score: float,
+    payload: Dict[str, Any] | None,
+) -> tuple:
+    # Scores are kept exact: the risk probability is not rounded, so rounding
+    # the key would hand back a neighbouring snapshot's result. The payload is
+    # reduced to the fields the scorers read rather than serialized whole.
+    inputs = signal_inputs(payload) if payload else None
+    return (airport, carrier, weather_score, aircraft_score, crew_score, inputs)
+
+
+@async_ttl_cache(
+    maxsize=settings.predictive_cache_size,
+    ttl=settings.predictive_cache_ttl,
+    key=_signal_cache_key,
+)
+async def _cached_signals(
+    airport: str,
+    carrier: str,
+    weather_score: float,
+    aircraft_score: float,
+    crew_score: float,
+    payload: Dict[str, Any] | None,
+) -> str:
+    return json_dumps(
+        _compute_signals(airport, carrier, weather_score, aircraft_score, crew_score, payload)
+    )
+
+
+def _compute_signals(
+    airport: str,
+    carrier: str,
+    weather_score: float,
+    aircraft_score: float,
+    crew_score: float,
+    payload: Dict[str, Any] | None,
+) -> Dict[str, Any]:
     if payload:
         # Copy so we do not mutate upstream state when we add fallbacks
         input_data = dict(payload)
@@ -74,14 +161,7 @@ async def predictive_signal_tool(
             },
         }
     
-    result = compute_predictive_signals(input_data)
-    
-    logger.info(
-        f"🎯 Predictive Tool: Risk={result['risk_probability']:.2%}, "
-        f"Detected={result['disruption_detected']}"
-    )
-    
-    return result
+    return compute_predictive_signals(input_data)
 
 
 async def rebooking_tool(
@@ -133,14 +213,15 @@ async def rebooking_tool(
         
         try:
             # Use comprehensive Amadeus re-accommodation tool
-            amadeus_result = await comprehensive_reaccommodation_tool(
-                origin=origin,
-                destination=destination,
-                original_departure_date=departure_date,
-                passenger_count=pax_count,
-                vip_count=vip_count,
-                delay_minutes=delay_minutes
-            )
+            async with _amadeus_slots():
+                amadeus_result = await comprehensive_reaccommodation_tool(
+                    origin=origin,
+                    destination=destination,
+                    original_departure_date=departure_date,
+                    passenger_count=pax_count,
+                    vip_count=vip_count,
+                    delay_minutes=delay_minutes
+                )
             
             # Merge Amadeus data with standard response
             result = {
@@ -159,16 +240,19 @@ async def rebooking_tool(
                 "reasoning": amadeus_result.get("reasoning", "")
             }
             
-            logger.info(
-                f"✈️  Rebooking Tool (Amadeus): {result['strategy']} for {pax_count} pax, "
-                f"Found {amadeus_result['flight_options']['count']} flights, "
-                f"Cost: ${amadeus_result['total_cost_estimate']:,.2f}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "✈️  Rebooking Tool (Amadeus): %s for %s pax, Found %s flights, Cost: $%s",
+                    result["strategy"],
+                    pax_count,
+                    amadeus_result["flight_options"]["count"],
+                    f"{amadeus_result['total_cost_estimate']:,.2f}",
+                )
             
             return result
             
         except Exception as e:
-            logger.error(f"Amadeus API failed, falling back to synthetic: {e}")
+            logger.error("Amadeus API failed, falling back to synthetic: %s", e)
             # Fall through to synthetic data
     
     # Synthetic data fallback
@@ -213,8 +297,10 @@ async def rebooking_tool(
     }
     
     logger.info(
-        f"✈️  Rebooking Tool (Synthetic): {strategy} for {pax_count} pax, "
-        f"Hotel={hotel_required}"
+        "✈️  Rebooking Tool (Synthetic): %s for %s pax, Hotel=%s",
+        strategy,
+        pax_count,
+        hotel_required,
     )
     
     return result
@@ -247,27 +333,19 @@ async def finance_tool(
     """
     # Compensation based on EU261/HKCAD
     if delay_minutes >= 180:
-        if flight_distance == "long":
-            per_pax_comp = 600
-        elif flight_distance == "medium":
-            per_pax_comp = 400
-        else:
-            per_pax_comp = 250
+        per_pax_comp = _LONG_DELAY_COMP_USD.get(flight_distance, _LONG_DELAY_COMP_USD["short"])
     elif delay_minutes >= 120:
-        per_pax_comp = 125
+        per_pax_comp = _SHORT_DELAY_COMP_USD
     else:
         per_pax_comp = 0
     
     compensation_usd = pax_count * per_pax_comp
     
     # Hotel and meals
-    hotel_meals_usd = 0
-    if hotel_required:
-        hotel_per_pax = 150  # Average hotel + meals
-        hotel_meals_usd = pax_count * hotel_per_pax
+    hotel_meals_usd = pax_count * _HOTEL_MEALS_PER_PAX_USD if hotel_required else 0
     
     # Operational costs (fuel, crew overtime, etc.)
-    operational_usd = random.randint(10000, 30000)
+    operational_usd = _OPERATIONAL_USD
     
     total_usd = compensation_usd + hotel_meals_usd + operational_usd
     
@@ -286,7 +364,7 @@ async def finance_tool(
         "reasoning": f"Total estimated impact: ${total_usd:,}"
     }
     
-    logger.info(f"💰 Finance Tool: Total=${total_usd:,}")
+    logger.info("💰 Finance Tool: %s", result["reasoning"])
     
     return result
 
@@ -344,8 +422,9 @@ async def crew_scheduling_tool(
     }
     
     logger.info(
-        f"👥 Crew Tool: Changes={crew_changes_needed}, "
-        f"Backup={backup_crew_required}"
+        "👥 Crew Tool: Changes=%s, Backup=%s",
+        crew_changes_needed,
+        backup_crew_required,
     )
     
     return result
@@ -5,8 +5,10 @@ Kit (ADK), mirroring the LangGraph implementation but with ADK's orchestration
 primitives (Sequential, Parallel agents).
 """
 
+import asyncio
 import logging
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple
 
 from .agents import (
     PredictiveAgent,
@@ -16,13 +18,50 @@ from .agents import (
     FinanceAgent,
     CrewAgent,
     AggregatorAgent,
+    SubAgentBatch,
 )
+from ..config import settings
+from ..services.amadeus_client import close_amadeus_client
 from .state import DisruptionState, create_initial_state, record_progress
 
 
 logger = logging.getLogger(__name__)
 
 
+class _AgentPipeline(NamedTuple):
+    predictive: PredictiveAgent
+    orchestrator: OrchestratorAgent
+    risk: RiskAgent
+    rebooking: RebookingAgent
+    finance: FinanceAgent
+    crew: CrewAgent
+    aggregator: AggregatorAgent
+    subagent_batch: SubAgentBatch
+
+
+@lru_cache(maxsize=1)
+def _build_pipeline() -> _AgentPipeline:
+    """Construct the agents once per process.
+    
+    Agents keep no per-run data (the run state is passed in), so every
+    workflow instance can share them along with their resolved LLM clients.
+    """
+    risk = RiskAgent()
+    rebooking = RebookingAgent()
+    finance = FinanceAgent()
+    crew = CrewAgent()
+    return _AgentPipeline(
+        predictive=PredictiveAgent(),
+        orchestrator=OrchestratorAgent(),
+        risk=risk,
+        rebooking=rebooking,
+        finance=finance,
+        crew=crew,
+        aggregator=AggregatorAgent(),
+        subagent_batch=SubAgentBatch(risk, rebooking, finance, crew),
+    )
+
+
 class DisruptionWorkflowADK:
     """ADK-based workflow for flight disruption management.
     
@@ -37,7 +76,7 @@ class DisruptionWorkflowADK:
     4. Aggregator Agent - Synthesizes final plan
     
     Architecture:
-        Predictive → [If disruption] → Orchestrator → Parallel(Risk, Rebooking, Finance, Crew) → Aggregator
+        Predictive → [If disruption] → Parallel(Orchestrator, Risk → Parallel(Crew, Rebooking ∥ Finance)) → Aggregator
     
     Usage:
         workflow = DisruptionWorkflowADK()
@@ -45,15 +84,16 @@ class DisruptionWorkflowADK:
     """
     
     def __init__(self):
-        """Initialize the ADK workflow with all agents."""
-        # Initialize all agents
-        self.predictive_agent = PredictiveAgent()
-        self.orchestrator_agent = OrchestratorAgent()
-        self.risk_agent = RiskAgent()
-        self.rebooking_agent = RebookingAgent()
-        self.finance_agent = FinanceAgent()
-        self.crew_agent = CrewAgent()
-        self.aggregator_agent = AggregatorAgent()
+        """Initialize the ADK workflow with the shared agent pipeline."""
+        pipeline = _build_pipeline()
+        self.predictive_agent = pipeline.predictive
+        self.orchestrator_agent = pipeline.orchestrator
+        self.risk_agent = pipeline.risk
+        self.rebooking_agent = pipeline.rebooking
+        self.finance_agent = pipeline.finance
+        self.crew_agent = pipeline.crew
+        self.aggregator_agent = pipeline.aggregator
+        self.subagent_batch = pipeline.subagent_batch
         
         logger.info("✅ DisruptionWorkflowADK initialized with ADK agents")
         
@@ -102,9 +142,7 @@ class DisruptionWorkflowADK:
                 - crew_rotation: Crew scheduling adjustments
                 - simulation_results: What-if scenario results
         """
-        logger.info("=" * 80)
-        logger.info("🚀 Starting ADK Disruption Workflow")
-        logger.info("=" * 80)
+        logger.info("🚀 Starting ADK Disruption Workflow", extra={"event": "workflow_start"})
         
         # Initialize state
         state = create_initial_state(flight_data)
@@ -128,50 +166,19 @@ class DisruptionWorkflowADK:
                 }
                 return self._format_output(state)
             
-            # Step 2: Orchestrator Agent
+            # Steps 2 + 3: Orchestrator and Sub-Agents
+            # The sub-agents only consume the predictive risk, not the
+            # orchestrator's plan, so both LLM stages run concurrently.
             logger.info("⚠️  Disruption detected - proceeding with orchestration")
-            state = record_progress(state, "OrchestratorAgent", "started", "Coordinating response strategy...")
-            state = await self.orchestrator_agent.run(state)
-            state = record_progress(state, "OrchestratorAgent", "complete", "Response plan created")
-            
-            # Step 3: Sub-Agents with dependency order
-            # Finance agent depends on Risk + Rebooking, so run in two phases
-            import asyncio
-            
-            logger.info("🔄 Phase 1: Running Risk and Rebooking agents...")
-            state = record_progress(state, "SubAgents", "started", "Running impact assessment agents...")
-            
-            # Phase 1: Risk and Rebooking can run in parallel
-            state = record_progress(state, "RiskAgent", "started", "Assessing risk and impact...")
-            state = record_progress(state, "RebookingAgent", "started", "Planning passenger re-accommodation...")
-            
-            risk_state, rebooking_state = await asyncio.gather(
-                self.risk_agent.run(state),
-                self.rebooking_agent.run(state)
+            run_subagents = (
+                self._run_subagents_batched
+                if settings.llm_batch_subagents
+                else self._run_subagents
             )
-            
-            # Both agents modify the same state object, use either result
-            state = risk_state
-            state = record_progress(state, "RiskAgent", "complete", "Risk assessment complete")
-            state = record_progress(state, "RebookingAgent", "complete", "Rebooking plan ready")
-            logger.info("✅ Phase 1 complete: Risk and Rebooking")
-            
-            # Phase 2: Finance and Crew can now run in parallel (Finance has its dependencies)
-            logger.info("🔄 Phase 2: Running Finance and Crew agents...")
-            state = record_progress(state, "FinanceAgent", "started", "Calculating financial impact...")
-            state = record_progress(state, "CrewAgent", "started", "Managing crew schedules...")
-            
-            finance_state, crew_state = await asyncio.gather(
-                self.finance_agent.run(state),
-                self.crew_agent.run(state)
+            state, _ = await asyncio.gather(
+                run_subagents(state),
+                self._run_orchestrator(state),
             )
-            
-            # Both agents modify the same state object, use either result
-            state = finance_state
-            state = record_progress(state, "FinanceAgent", "complete", "Cost estimate complete")
-            state = record_progress(state, "CrewAgent", "complete", "Crew plan ready")
-            logger.info("✅ Phase 2 complete: Finance and Crew")
-            
             logger.info("✅ All sub-agents complete")
             
             # Step 4: Aggregator Agent
@@ -180,22 +187,95 @@ class DisruptionWorkflowADK:
             state = record_progress(state, "AggregatorAgent", "complete", "Final plan ready")
             state = record_progress(state, "Workflow", "complete", "Analysis complete")
             
-            logger.info("=" * 80)
-            logger.info("✅ ADK Disruption Workflow Complete")
-            logger.info("=" * 80)
+            logger.info("✅ ADK Disruption Workflow Complete", extra={"event": "workflow_complete"})
             
             return self._format_output(state)
             
         except Exception as e:
-            logger.error(f"❌ Workflow error: {e}", exc_info=True)
+            logger.error("❌ Workflow error: %s", e, exc_info=True)
             # Return error state
             return {
                 "error": str(e),
                 "disruption_detected": state.disruption_detected,
-                "audit_log": state.audit_log,
+                "audit_log": state.audit_log.to_list(),
                 "final_plan": {"error": "Workflow execution failed"}
             }
     
+    async def _run_orchestrator(self, state: DisruptionState) -> DisruptionState:
+        """Run the orchestrator, which streams its plan and what-if scenarios."""
+        state = record_progress(state, "OrchestratorAgent", "started", "Coordinating response strategy...")
+        state = await self.orchestrator_agent.run(state)
+        state = record_progress(state, "OrchestratorAgent", "complete", "Response plan created")
+        return state
+    
+    async def _run_subagents(self, state: DisruptionState) -> DisruptionState:
+        """Run each sub-agent with its own LLM call.
+        
+        Rebooking and Crew size their plans from the Risk agent's duration
+        estimate, so Risk runs first and Crew then runs alongside the
+        overlapped Rebooking and Finance pair.
+        """
+        state = record_progress(state, "SubAgents", "started", "Running impact assessment agents...")
+        
+        logger.info("🔄 Phase 1: Running Risk agent...")
+        state = record_progress(state, "RiskAgent", "started", "Assessing risk and impact...")
+        state = await self.risk_agent.run(state)
+        state = record_progress(state, "RiskAgent", "complete", "Risk assessment complete")
+        
+        # Low-risk runs keep the deterministic tool estimates and skip the
+        # Finance and Crew LLM reviews.
+        refine = (
+            state.risk_assessment.get("risk_probability", 1.0)
+            >= settings.subagent_risk_threshold
+        )
+        logger.info("🔄 Phase 2: Running Crew alongside Rebooking and Finance...")
+        if not refine:
+            logger.info("↘️  Low risk - using tool estimates for Finance and Crew")
+        
+        # Each agent writes its own field on the shared state, so both
+        # branches return the same object.
+        await asyncio.gather(
+            self._run_crew(state, refine),
+            self._run_rebooking_and_finance(state, refine),
+        )
+        logger.info("✅ Phase 2 complete: Rebooking, Finance and Crew")
+        
+        return state
+    
+    async def _run_crew(self, state: DisruptionState, refine: bool) -> DisruptionState:
+        state = record_progress(state, "CrewAgent", "started", "Managing crew schedules...")
+        state = await self.crew_agent.run(state, refine=refine)
+        return record_progress(state, "CrewAgent", "complete", "Crew plan ready")
+    
+    async def _run_rebooking_and_finance(
+        self, state: DisruptionState, refine: bool
+    ) -> DisruptionState:
+        """Price the rebooking tool plan while the rebooking LLM refines it.
+        
+        Finance only needs the passenger count and hotel decision, which the
+        tool plan already carries. The pre-estimate is reused unless the
+        refined plan changed either of them, in which case Finance re-prices.
+        """
+        state = record_progress(state, "RebookingAgent", "started", "Planning passenger re-accommodation...")
+        rebooking_draft = await self.rebooking_agent.draft(state)
+        state = record_progress(state, "FinanceAgent", "started", "Calculating financial impact...")
+        llm_plan, finance_draft = await asyncio.gather(
+            self.rebooking_agent.refine(rebooking_draft),
+            self.finance_agent.draft(state, rebooking=rebooking_draft["tool_plan"]),
+        )
+        state = self.rebooking_agent.commit(state, rebooking_draft, llm_plan)
+        state = record_progress(state, "RebookingAgent", "complete", "Rebooking plan ready")
+        state = await self.finance_agent.run(state, refine=refine, pre_estimate=finance_draft)
+        return record_progress(state, "FinanceAgent", "complete", "Cost estimate complete")
+    
+    async def _run_subagents_batched(self, state: DisruptionState) -> DisruptionState:
+        """Run the sub-agents with one combined LLM call (LLM_BATCH_SUBAGENTS)."""
+        logger.info("🔄 Running Risk, Rebooking, Finance and Crew as one batch...")
+        state = record_progress(state, "SubAgents", "started", "Running impact assessment agents...")
+        state = await self.subagent_batch.run(state)
+        state = record_progress(state, "SubAgents", "complete", "Impact assessment complete")
+        return state
+    
     def _format_output(self, state: DisruptionState) -> Dict[str, Any]:
         """Format state into output dictionary.
         
@@ -207,7 +287,7 @@ class DisruptionWorkflowADK:
         """
         return {
             "final_plan": state.final_plan,
-            "audit_log": state.audit_log,
+            "audit_log": state.audit_log.to_list(),
             "disruption_detected": state.disruption_detected,
             "risk_assessment": state.risk_assessment,
             "signal_breakdown": state.signal_breakdown,
@@ -222,21 +302,24 @@ class DisruptionWorkflowADK:
     def run_sync(self, flight_data: Dict[str, Any]) -> Dict[str, Any]:
         """Synchronous wrapper for run() for non-async contexts.
         
+        Runs the async workflow on a fresh event loop so the sub-agents are
+        still fanned out concurrently, and closes the pooled Amadeus
+        connections before that loop ends. Must not be called from a running
+        loop; await run() there instead.
+        
         Args:
             flight_data: Output from FlightMonitorProvider
             
         Returns:
             Same as run()
         """
-        import asyncio
-        
+        return asyncio.run(self._run_and_close(flight_data))
+
+    async def _run_and_close(self, flight_data: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.run(flight_data))
+            return await self.run(flight_data)
+        finally:
+            await close_amadeus_client()
 
 
 # Convenience function for direct workflow execution
@@ -16,6 +16,7 @@ AGENTIC_ENGINES = {"apiv2"}  # Only APIV2 (ADK) is supported
 @dataclass(slots=True)
 class Settings:
     default_mode: str = "synthetic"
+    log_format: str = "text"  # text or json
     aviationstack_api_key: str | None = None
     aviationstack_base_url: str = "https://api.aviationstack.com/v1"
     mongo_uri: str = "mongodb://localhost:27017"
@@ -38,6 +39,20 @@ class Settings:
     llm_provider: str = "openai"  # openai, openrouter, deepseek, gemini
     llm_model: str = "gpt-4o"
     llm_temperature: float = 0.2
+    llm_request_timeout: float = 15.0  # seconds per provider call
+    llm_max_retries: int = 1
+    llm_cache_ttl: float = 900.0  # seconds; 0 disables the response cache
+    llm_cache_size: int = 10_000
+    llm_batch_subagents: bool = False  # one combined LLM call for the sub-agents
+    # Micro-batching window for concurrent LLM calls; 0 disables it
+    llm_max_latency_ms: float = 0.0
+    llm_max_batch: int = 16
+    llm_warmup_ping: bool = True  # send a 1-token probe when warming at startup
+    audit_log_max_entries: int = 1024
+    # Below this risk probability Finance/Crew skip their LLM review
+    subagent_risk_threshold: float = 0.4
+    predictive_cache_ttl: float = 60.0  # seconds; 0 disables the signal cache
+    predictive_cache_size: int = 512
     # Provider-specific API keys
     openai_api_key: str | None = None
     openrouter_api_key: str | None = None
@@ -51,12 +66,15 @@ class Settings:
     amadeus_client_id: str | None = None
     amadeus_client_secret: str | None = None
     amadeus_environment: str = "test"  # test or production
+    amadeus_max_concurrency: int = 4  # in-flight re-accommodation searches
+    amadeus_search_cache_ttl: float = 120.0  # seconds; 0 disables the search cache
 
     def __post_init__(self) -> None:
         mode = os.getenv("FLIGHT_MONITOR_MODE", "synthetic").lower()
         if mode not in ALLOWED_MODES:
             mode = "synthetic"
         self.default_mode = mode
+        self.log_format = os.getenv("LOG_FORMAT", self.log_format).lower()
         self.aviationstack_api_key = os.getenv("AVIATIONSTACK_API_KEY")
         self.aviationstack_base_url = os.getenv(
             "AVIATIONSTACK_BASE_URL", self.aviationstack_base_url
@@ -114,6 +132,42 @@ class Settings:
         self.llm_temperature = float(
             os.getenv("LLM_TEMPERATURE", str(self.llm_temperature))
         )
+        self.llm_request_timeout = float(
+            os.getenv("LLM_REQUEST_TIMEOUT", str(self.llm_request_timeout))
+        )
+        self.llm_max_retries = int(
+            os.getenv("LLM_MAX_RETRIES", str(self.llm_max_retries))
+        )
+        self.llm_cache_ttl = float(
+            os.getenv("LLM_CACHE_TTL", str(self.llm_cache_ttl))
+        )
+        self.llm_cache_size = int(
+            os.getenv("LLM_CACHE_SIZE", str(self.llm_cache_size))
+        )
+        self.llm_batch_subagents = os.getenv(
+            "LLM_BATCH_SUBAGENTS", "false"
+        ).lower() in ("true", "1", "yes")
+        self.llm_warmup_ping = os.getenv(
+            "LLM_WARMUP_PING", "true"
+        ).lower() in ("true", "1", "yes")
+        self.llm_max_latency_ms = float(
+            os.getenv("LLM_MAX_LATENCY_MS", str(self.llm_max_latency_ms))
+        )
+        self.llm_max_batch = int(
+            os.getenv("LLM_MAX_BATCH", str(self.llm_max_batch))
+        )
+        self.audit_log_max_entries = int(
+            os.getenv("AUDIT_LOG_MAX_ENTRIES", str(self.audit_log_max_entries))
+        )
+        self.subagent_risk_threshold = float(
+            os.getenv("SUBAGENT_RISK_THRESHOLD", str(self.subagent_risk_threshold))
+        )
+        self.predictive_cache_ttl = float(
+            os.getenv("PREDICTIVE_CACHE_TTL", str(self.predictive_cache_ttl))
+        )
+        self.predictive_cache_size = int(
+            os.getenv("PREDICTIVE_CACHE_SIZE", str(self.predictive_cache_size))
+        )
         # Provider API keys
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
@@ -131,6 +185,12 @@ class Settings:
         self.amadeus_client_id = os.getenv("AMADEUS_CLIENT_ID")
         self.amadeus_client_secret = os.getenv("AMADEUS_CLIENT_SECRET")
         self.amadeus_environment = os.getenv("AMADEUS_ENVIRONMENT", self.amadeus_environment)
+        self.amadeus_max_concurrency = int(
+            os.getenv("AMADEUS_MAX_CONCURRENCY", str(self.amadeus_max_concurrency))
+        )
+        self.amadeus_search_cache_ttl = float(
+            os.getenv("AMADEUS_SEARCH_CACHE_TTL", str(self.amadeus_search_cache_ttl))
+        )
 
 
 settings = Settings()
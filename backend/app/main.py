@@ -6,19 +6,25 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .exceptions import ProviderConfigError, ProviderDataError
+from .log_format import JsonFormatter
 from .providers import ProviderMode, resolve_provider
 from .routes import agentic, agent_reaccommodation, agent_options, reaccommodation, whatif
 from .services import reaccommodation as reaccom_service
 from .services import mongo_client
+from .services.amadeus_client import close_amadeus_client
 from .services.predictive_signals import compute_predictive_signals
 from .services.disruption_updater import get_disruption_updater
 from .agentsv2 import api as agentsv2_api
+from .agentsv2.llm import warmup_llm
 
 # Configure logging to show INFO level and above
 logging.basicConfig(
     level=logging.INFO,
     format='%(levelname)s:     %(name)s - %(message)s',
 )
+if settings.log_format == "json":
+    for handler in logging.getLogger().handlers:
+        handler.setFormatter(JsonFormatter())
 
 # Set specific loggers to INFO to see agent communications
 logging.getLogger("app.routes.agent_options").setLevel(logging.INFO)
@@ -163,7 +169,16 @@ async def get_predictive_alerts(
     }
 
 
+@app.on_event("startup")
+async def startup_event() -> None:
+    """Warm the workflow and LLM client so the first agent analysis skips setup."""
+    if settings.agentic_enabled:
+        agentsv2_api.get_workflow()
+        await warmup_llm(ping=settings.llm_warmup_ping)
+
+
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
-    """Ensure Mongo clients are closed on shutdown."""
+    """Ensure Mongo and Amadeus clients are closed on shutdown."""
     mongo_client.close_client()
+    await close_amadeus_client()
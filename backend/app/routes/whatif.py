@@ -7,7 +7,6 @@ without affecting actual flight data.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Any, Dict, Literal
 
@@ -15,6 +14,7 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from ..agentsv2.serialization import json_dumps
 from ..config import settings
 from ..providers import ProviderMode, resolve_provider
 from ..services.agentic import agentic_service
@@ -107,7 +107,7 @@ async def analyze_whatif_scenario_stream(
             try:
                 payload = await provider.get_payload(airport.upper(), carrier.upper())
             except Exception as e:
-                error_data = json.dumps({"error": f"Failed to fetch flight data: {str(e)}"})
+                error_data = json_dumps({"error": f"Failed to fetch flight data: {str(e)}"})
                 yield f"event: error\ndata: {error_data}\n\n"
                 return
             
@@ -119,7 +119,7 @@ async def analyze_whatif_scenario_stream(
             )
             
             if not flight:
-                error_data = json.dumps({"error": f"Flight {scenario.flight_number} not found"})
+                error_data = json_dumps({"error": f"Flight {scenario.flight_number} not found"})
                 yield f"event: error\ndata: {error_data}\n\n"
                 return
             
@@ -148,7 +148,7 @@ async def analyze_whatif_scenario_stream(
             
             # Progress callback for SSE
             def progress_callback(agent: str, status: str, message: str):
-                event_data = json.dumps({
+                event_data = json_dumps({
                     "agent": agent,
                     "status": status,
                     "message": message
@@ -182,7 +182,7 @@ async def analyze_whatif_scenario_stream(
             # Send progress updates from the completed analysis
             progress_updates = analysis.get("progress_updates", [])
             for progress in progress_updates:
-                event_data = json.dumps(progress)
+                event_data = json_dumps(progress)
                 yield f"event: progress\ndata: {event_data}\n\n"
                 await asyncio.sleep(0.1)  # Small delay for visual effect
             
@@ -218,12 +218,12 @@ async def analyze_whatif_scenario_stream(
                 "timestamp": analysis.get("timestamp"),
             }
             
-            result_data = json.dumps(result)
+            result_data = json_dumps(result)
             yield f"event: complete\ndata: {result_data}\n\n"
             
         except Exception as e:
             logger.error(f"❌ What-if analysis failed: {e}")
-            error_data = json.dumps({"error": str(e)})
+            error_data = json_dumps({"error": str(e)})
             yield f"event: error\ndata: {error_data}\n\n"
     
     return StreamingResponse(
@@ -9,6 +9,8 @@ This module provides a wrapper around the Amadeus Self-Service APIs for:
 Uses the test environment by default with static data for development.
 """
 
+import asyncio
+import importlib.util
 import logging
 import os
 from datetime import datetime, timedelta
@@ -20,6 +22,17 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# One pooled connection set per client: the token refresh and the flight and
+# hotel searches reuse warm TLS connections instead of handshaking per call.
+# Idle connections are kept past httpx's 5s default so that consecutive
+# workflow runs, not just the calls within one run, share them; a connection
+# the server has since closed is detected and replaced on checkout.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0
+)
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 class AmadeusAPIError(Exception):
     """Custom exception for Amadeus API errors."""
@@ -63,9 +76,54 @@ class AmadeusClient:
         
         self._access_token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
         
         logger.info(f"🌍 Amadeus client initialized (env={environment})")
     
+    async def _http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use.
+        
+        Connection pools are bound to the event loop that opened them, so a
+        new client is created if called from a different loop, after closing
+        the old one.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is not None and self._http_loop is not loop:
+            await self._close_stale_http()
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=_HTTP2
+            )
+            self._http_loop = loop
+        return self._http
+    
+    async def _close_stale_http(self) -> None:
+        """Close a client opened on another event loop instead of leaking its pool."""
+        client, client_loop = self._http, self._http_loop
+        self._http = None
+        self._http_loop = None
+        if client is None or client.is_closed or client_loop is None or client_loop.is_closed():
+            # Nothing can run on a closed loop; the garbage collector frees it.
+            return
+        try:
+            if client_loop.is_running():
+                # Close on the loop that owns the connections.
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+                )
+            else:
+                await client.aclose()
+        except Exception as exc:  # pragma: no cover - best effort cleanup
+            logger.warning(f"Failed to close stale Amadeus HTTP client: {exc}")
+    
+    async def aclose(self) -> None:
+        """Close pooled connections (called on application shutdown)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._http_loop = None
+    
     async def _get_access_token(self) -> str:
         """Get or refresh OAuth2 access token.
         
@@ -90,26 +148,25 @@ class AmadeusClient:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    auth_url,
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"}
+            response = await (await self._http_client()).post(
+                auth_url,
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            
+            if response.status_code != 200:
+                raise AmadeusAPIError(
+                    f"Authentication failed: {response.status_code} - {response.text}"
                 )
-                
-                if response.status_code != 200:
-                    raise AmadeusAPIError(
-                        f"Authentication failed: {response.status_code} - {response.text}"
-                    )
-                
-                token_data = response.json()
-                self._access_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 1800)  # Default 30 min
-                self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
-                
-                logger.info("✅ Amadeus access token refreshed")
-                return self._access_token
-                
+            
+            token_data = response.json()
+            self._access_token = token_data["access_token"]
+            expires_in = token_data.get("expires_in", 1800)  # Default 30 min
+            self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
+            
+            logger.info("✅ Amadeus access token refreshed")
+            return self._access_token
+            
         except httpx.HTTPError as e:
             raise AmadeusAPIError(f"HTTP error during authentication: {e}")
     
@@ -143,29 +200,29 @@ class AmadeusClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=headers, params=params)
-                elif method.upper() == "POST":
-                    response = await client.post(url, headers=headers, json=json_data)
-                else:
-                    raise AmadeusAPIError(f"Unsupported HTTP method: {method}")
-                
-                # Handle errors
-                if response.status_code >= 400:
-                    error_detail = response.text
-                    try:
-                        error_json = response.json()
-                        error_detail = error_json.get("errors", [{}])[0].get("detail", error_detail)
-                    except:
-                        pass
-                    
-                    raise AmadeusAPIError(
-                        f"API request failed: {response.status_code} - {error_detail}"
-                    )
-                
-                return response.json()
+            client = await self._http_client()
+            if method.upper() == "GET":
+                response = await client.get(url, headers=headers, params=params)
+            elif method.upper() == "POST":
+                response = await client.post(url, headers=headers, json=json_data)
+            else:
+                raise AmadeusAPIError(f"Unsupported HTTP method: {method}")
+            
+            # Handle errors
+            if response.status_code >= 400:
+                error_detail = response.text
+                try:
+                    error_json = response.json()
+                    error_detail = error_json.get("errors", [{}])[0].get("detail", error_detail)
+                except:
+                    pass
                 
+                raise AmadeusAPIError(
+                    f"API request failed: {response.status_code} - {error_detail}"
+                )
+            
+            return response.json()
+            
         except httpx.HTTPError as e:
             raise AmadeusAPIError(f"HTTP error during request: {e}")
     
@@ -506,3 +563,9 @@ def get_amadeus_client() -> AmadeusClient:
         _amadeus_client = AmadeusClient()
     
     return _amadeus_client
+
+
+async def close_amadeus_client() -> None:
+    """Release the singleton's pooled connections, if it was ever created."""
+    if _amadeus_client is not None:
+        await _amadeus_client.aclose()
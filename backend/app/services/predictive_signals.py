@@ -23,6 +23,18 @@ WEATHER_KEYWORDS = (
 )
 
 
+# Stats fields read by compute_predictive_signals and _score_weather.
+_STAT_INPUTS = (
+    "totalFlights",
+    "delayed",
+    "critical",
+    "avgDelayMinutes",
+    "weatherScore",
+    "crewScore",
+    "aircraftScore",
+)
+
+
 @dataclass
 class SignalBreakdown:
     """Typed helper used internally while computing risk contributions."""
@@ -116,6 +128,34 @@ def _score_aircraft(data: Dict[str, Any]) -> SignalBreakdown:
     return SignalBreakdown(score=_clamp(raw_score), evidence=evidence, impact_count=aircraft_not_ready or mx_holds)
 
 
+def signal_inputs(data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the fields the scorers read, as a hashable tuple.
+
+    Two payloads with equal inputs score identically, so this is a cheap cache
+    key that skips serializing the rest of each flight. Keep it in step with
+    the ``_score_*`` helpers above.
+    """
+
+    stats = data.get("stats", {}) or {}
+    return (
+        tuple(stats.get(key) for key in _STAT_INPUTS),
+        tuple(alert.get("message", "") for alert in data.get("alerts", [])),
+        tuple(
+            (
+                (flight.get("irregularOps", {}) or {}).get("reason", ""),
+                flight.get("crewReady", True),
+                flight.get("aircraftReady", True),
+            )
+            for flight in data.get("flights", [])
+        ),
+        tuple(
+            (panel.get("fatigueRisk"), panel.get("readinessState"))
+            for panel in data.get("crewPanels", [])
+        ),
+        tuple(plane.get("statusCategory") for plane in data.get("aircraftPanels", [])),
+    )
+
+
 def compute_predictive_signals(data: Dict[str, Any]) -> Dict[str, Any]:
     """Return disruption probability plus weather/crew/aircraft breakdown."""
 